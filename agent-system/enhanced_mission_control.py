@@ -10,6 +10,7 @@ import asyncio
 import time
 import json
 import threading
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
@@ -17,11 +18,29 @@ from enum import Enum
 import subprocess
 import logging
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from types import MappingProxyType
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import urllib.parse
+from collections import deque
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Import our existing systems
-from autonomous_agent_loops import get_mission_control, AgentMissionType, AgentStatus
+from _compat import DATACLASS_SLOTS
+from autonomous_agent_loops import get_mission_control, AgentMission, AgentMissionType, AgentStatus
 from realtime_cognitive_mirror import get_cognitive_mirror
 from ai_centric_dashboard import AICentricDashboard
 
@@ -36,6 +55,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger('enhanced_mission_control')
 
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+}
+
+# Dashboard panels poll several endpoints at once; serialized GET responses
+# are shared for this long so a burst of polls costs one computation
+RESPONSE_CACHE_TTL = 0.5
+
+# The performance monitor pre-renders every GET endpoint this often, so polls
+# are served from the published snapshot instead of being computed per request
+SNAPSHOT_INTERVAL = 1.0
+# How often the monitor reflects on mission load in the cognitive mirror
+PERFORMANCE_REFLECT_INTERVAL = 30.0
+# get_mission_control_dashboard() walks every mission and agent; one result
+# is shared by all handlers that run within this window
+DASHBOARD_MAX_AGE = 0.25
+
+# Commands kept for /logs; older entries are dropped so memory stays bounded
+COMMAND_LOG_SIZE = 500
+
+
+def _json_default(obj):
+    """Serialize values the JSON encoders don't handle natively (command log timestamps)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Encode an API response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Decode a request body; orjson parses the raw bytes without a str copy"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
 class ControlCommand(Enum):
     """Commands that can be sent to the mission control system"""
     SPAWN_AGENT = "spawn_agent"
@@ -46,7 +111,7 @@ class ControlCommand(Enum):
     GET_LOGS = "get_logs"
     EXPORT_DATA = "export_data"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ControlResponse:
     """Response from mission control system"""
     success: bool
@@ -54,6 +119,16 @@ class ControlResponse:
     message: str
     timestamp: datetime
     
+    @classmethod
+    def ok(cls, data: Any, message: str, timestamp: Optional[datetime] = None) -> 'ControlResponse':
+        """Successful response; pass the handler's own timestamp to avoid another clock read"""
+        return cls(True, data, message, timestamp or datetime.now())
+    
+    @classmethod
+    def err(cls, message: str, data: Any = None, timestamp: Optional[datetime] = None) -> 'ControlResponse':
+        """Failed response; pass the handler's own timestamp to avoid another clock read"""
+        return cls(False, data, message, timestamp or datetime.now())
+    
     def to_dict(self):
         return {
             'success': self.success,
@@ -68,6 +143,10 @@ class EnhancedMissionControl:
     Bridges between agent loops, consciousness streaming, and web dashboard
     """
     
+    # value -> member, so unknown mission types are a dict miss rather than
+    # a ValueError raised and caught per request
+    _MISSION_TYPES = AgentMissionType._value2member_map_
+    
     def __init__(self, port: int = 8086):
         self.port = port
         self.mission_control = get_mission_control()
@@ -75,7 +154,7 @@ class EnhancedMissionControl:
         self.ai_dashboard = AICentricDashboard()
         
         # Enhanced tracking
-        self.command_log = []
+        self.command_log = deque(maxlen=COMMAND_LOG_SIZE)
         self.performance_metrics = {
             'total_missions': 0,
             'successful_missions': 0,
@@ -84,8 +163,44 @@ class EnhancedMissionControl:
             'agent_efficiency': 0.0
         }
         
+        # Request routing: one dict lookup instead of an if/elif ladder
+        self._get_handlers = {
+            '/status': self.get_system_status,
+            '/missions': self.get_missions_data,
+            '/agents': self.get_agents_data,
+            '/logs': self.get_system_logs,
+            '/metrics': self.get_performance_metrics,
+            '/consciousness': self.get_consciousness_state
+        }
+        self._post_handlers = {
+            ControlCommand.SPAWN_AGENT.value: self.spawn_agent_command,
+            ControlCommand.TERMINATE_AGENT.value: self.terminate_agent_command,
+            ControlCommand.RECONFIGURE_AGENT.value: self.reconfigure_agent_command,
+            ControlCommand.EMERGENCY_STOP.value: lambda params: self.emergency_stop_command()
+        }
+        # Mission types with a dedicated constructor; everything else gets a
+        # generic mission. Factories take (objective, duration).
+        self._mission_factories = {
+            AgentMissionType.RESEARCH: lambda objective, duration: self.mission_control.create_research_mission(objective),
+            AgentMissionType.DEBUG: lambda objective, duration: self.mission_control.create_debug_mission(objective),
+            AgentMissionType.ANALYZE: lambda objective, duration: self.mission_control.create_analysis_mission(objective),
+            AgentMissionType.MONITOR: self.mission_control.create_monitor_mission
+        }
+        
+        # path -> (monotonic time, serialized response body)
+        self._response_cache: Dict[str, tuple] = {}
+        # (monotonic publish time, read-only path -> body mapping); replaced
+        # wholesale by the monitor, so readers never need a lock
+        self._snapshot = (float('-inf'), MappingProxyType({}))
+        # Set by commands that change mission state so the monitor republishes
+        # the snapshot immediately instead of at its next tick
+        self._state_changed = threading.Event()
+        # (monotonic time, dashboard dict) from the last mission control walk
+        self._dashboard_cache = (float('-inf'), None)
+        
         # Web server for dashboard API
         self.http_server = None
+        self.web_runner = None
         self.server_thread = None
         
         logger.info("🎮 Enhanced Mission Control initialized")
@@ -94,46 +209,164 @@ class EnhancedMissionControl:
     
     def _start_web_server(self):
         """Start HTTP server for dashboard API"""
-        handler = self._create_request_handler()
+        if web is not None:
+            run_server = self._run_aiohttp_server
+        else:
+            handler = self._create_request_handler()
+            
+            def run_server():
+                try:
+                    # Thread per connection, so one slow endpoint doesn't
+                    # block other dashboard panels' connections
+                    self.http_server = ThreadingHTTPServer(('localhost', self.port), handler)
+                    logger.info("🌐 Mission Control API server started on http://localhost:%s", self.port)
+                    self.http_server.serve_forever()
+                except Exception as e:
+                    logger.error("❌ Failed to start web server: %s", e)
+        
+        self.server_thread = threading.Thread(target=run_server, daemon=True)
+        self.server_thread.start()
+    
+    def _run_aiohttp_server(self):
+        """Serve the dashboard API with aiohttp on this thread's own event loop"""
+        # Only this thread's loop runs on uvloop; setting the global policy
+        # would also swap the loops other components create in this process
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self.web_runner = web.AppRunner(self._create_web_app(), access_log=None)
+            loop.run_until_complete(self.web_runner.setup())
+            site = web.TCPSite(self.web_runner, 'localhost', self.port)
+            loop.run_until_complete(site.start())
+            logger.info("🌐 Mission Control API server started on http://localhost:%s (aiohttp)", self.port)
+            loop.run_forever()
+        except Exception as e:
+            logger.error("❌ Failed to start web server: %s", e)
+    
+    def _create_web_app(self):
+        """Create the aiohttp application for the dashboard API"""
         
-        def run_server():
+        async def handle_get(request):
             try:
-                self.http_server = HTTPServer(('localhost', self.port), handler)
-                logger.info(f"🌐 Mission Control API server started on http://localhost:{self.port}")
-                self.http_server.serve_forever()
+                # The endpoint producers are synchronous and can be slow
+                # (cognitive report), so run them off the loop; concurrent
+                # dashboard polls no longer queue behind each other
+                body = await asyncio.get_running_loop().run_in_executor(
+                    None, self.get_response_body, request.path)
+                return self._json_response(200, body)
             except Exception as e:
-                logger.error(f"❌ Failed to start web server: {e}")
+                logger.error("❌ GET request error: %s", e)
+                return self._json_response(500, _dumps_json({'error': str(e)}))
         
-        self.server_thread = threading.Thread(target=run_server, daemon=True)
-        self.server_thread.start()
+        async def handle_post(request):
+            try:
+                request_data = _loads_json(await request.read())
+                response = await asyncio.get_running_loop().run_in_executor(
+                    None, self.handle_command, request_data)
+                return self._json_response(200, _dumps_json(response.to_dict()))
+            except Exception as e:
+                logger.error("❌ POST request error: %s", e)
+                return self._json_response(500, _dumps_json({'error': str(e)}))
+        
+        async def handle_options(request):
+            return web.Response(headers=CORS_HEADERS)
+        
+        app = web.Application()
+        app.router.add_get('/{path:.*}', handle_get)
+        app.router.add_post('/{path:.*}', handle_post)
+        app.router.add_route('OPTIONS', '/{path:.*}', handle_options)
+        return app
+    
+    def _json_response(self, status_code, body: bytes):
+        """Build an aiohttp JSON response carrying the CORS headers"""
+        return web.Response(
+            status=status_code,
+            body=body,
+            content_type='application/json',
+            headers=CORS_HEADERS
+        )
+    
+    def get_response_body(self, path: str) -> bytes:
+        """Serialized GET response from the published snapshot or a short-lived cache"""
+        if path not in self._get_handlers:
+            return _dumps_json(self.handle_get_request(path).to_dict())
+        now = time.monotonic()
+        published_at, bodies = self._snapshot
+        if now - published_at < 2 * SNAPSHOT_INTERVAL:
+            return bodies[path]
+        # No fresh snapshot (startup, or the monitor is backing off after an
+        # error): compute on demand, still collapsing bursts of polls
+        cached = self._response_cache.get(path)
+        if cached is not None and now - cached[0] < RESPONSE_CACHE_TTL:
+            return cached[1]
+        body = _dumps_json(self.handle_get_request(path).to_dict())
+        self._response_cache[path] = (now, body)
+        return body
+    
+    def _publish_snapshot(self):
+        """Pre-render every cached GET endpoint and publish them atomically"""
+        bodies = {path: _dumps_json(self.handle_get_request(path).to_dict())
+                  for path in self._get_handlers}
+        self._snapshot = (time.monotonic(), MappingProxyType(bodies))
+    
+    def _dashboard(self, max_age: float = DASHBOARD_MAX_AGE) -> Dict[str, Any]:
+        """Mission control dashboard, reused if fetched within max_age seconds"""
+        now = time.monotonic()
+        fetched_at, dashboard_data = self._dashboard_cache
+        if now - fetched_at > max_age:
+            dashboard_data = self.mission_control.get_mission_control_dashboard()
+            self._dashboard_cache = (now, dashboard_data)
+        return dashboard_data
+    
+    def _notify_state_changed(self):
+        """Drop the cached dashboard and wake the monitor to republish"""
+        self._dashboard_cache = (float('-inf'), None)
+        self._state_changed.set()
+    
+    def handle_get_request(self, path: str) -> ControlResponse:
+        """Route a dashboard GET to its endpoint"""
+        handler = self._get_handlers.get(path)
+        if handler is None:
+            return ControlResponse.err("Endpoint not found")
+        return handler()
+    
+    def handle_command(self, request_data: Dict[str, Any]) -> ControlResponse:
+        """Route a dashboard POST command to its handler"""
+        command = request_data.get('command')
+        handler = self._post_handlers.get(command)
+        if handler is None:
+            return ControlResponse.err(f"Unknown command: {command}")
+        return handler(request_data.get('params', {}))
     
     def _create_request_handler(self):
         """Create HTTP request handler class"""
         mission_control = self
         
         class MissionControlHandler(BaseHTTPRequestHandler):
+            # HTTP/1.1 keeps the dashboard's polling connection open across
+            # requests (every response carries Content-Length for this)
+            protocol_version = "HTTP/1.1"
+            # Responses are small and written in one piece; don't let Nagle
+            # hold them back waiting for an ACK
+            disable_nagle_algorithm = True
+            # Identical on every response, so encode them once
+            _CORS_HEADERS = "".join(
+                f"{name}: {value}\r\n" for name, value in CORS_HEADERS.items()
+            ).encode('latin-1')
+            # Preflights carry no body and nothing per-request
+            _OPTIONS_RESPONSE = (
+                f"{protocol_version} 200 OK\r\n".encode('latin-1')
+                + _CORS_HEADERS
+                + b"Content-Length: 0\r\n\r\n"
+            )
+            
             def do_GET(self):
                 """Handle GET requests"""
                 try:
-                    if self.path == '/status':
-                        response = mission_control.get_system_status()
-                    elif self.path == '/missions':
-                        response = mission_control.get_missions_data()
-                    elif self.path == '/agents':
-                        response = mission_control.get_agents_data()
-                    elif self.path == '/logs':
-                        response = mission_control.get_system_logs()
-                    elif self.path == '/metrics':
-                        response = mission_control.get_performance_metrics()
-                    elif self.path == '/consciousness':
-                        response = mission_control.get_consciousness_state()
-                    else:
-                        response = ControlResponse(False, None, "Endpoint not found", datetime.now())
-                    
-                    self._send_json_response(200, response.to_dict())
+                    self._send_json_body(200, mission_control.get_response_body(self.path))
                     
                 except Exception as e:
-                    logger.error(f"❌ GET request error: {e}")
+                    logger.error("❌ GET request error: %s", e)
                     self._send_json_response(500, {'error': str(e)})
             
             def do_POST(self):
@@ -141,79 +374,82 @@ class EnhancedMissionControl:
                 try:
                     content_length = int(self.headers['Content-Length'])
                     post_data = self.rfile.read(content_length)
-                    request_data = json.loads(post_data.decode('utf-8'))
-                    
-                    command = request_data.get('command')
-                    params = request_data.get('params', {})
-                    
-                    if command == ControlCommand.SPAWN_AGENT.value:
-                        response = mission_control.spawn_agent_command(params)
-                    elif command == ControlCommand.TERMINATE_AGENT.value:
-                        response = mission_control.terminate_agent_command(params)
-                    elif command == ControlCommand.RECONFIGURE_AGENT.value:
-                        response = mission_control.reconfigure_agent_command(params)
-                    elif command == ControlCommand.EMERGENCY_STOP.value:
-                        response = mission_control.emergency_stop_command()
-                    else:
-                        response = ControlResponse(False, None, f"Unknown command: {command}", datetime.now())
-                    
+                    request_data = _loads_json(post_data)
+                    response = mission_control.handle_command(request_data)
                     self._send_json_response(200, response.to_dict())
                     
                 except Exception as e:
-                    logger.error(f"❌ POST request error: {e}")
+                    logger.error("❌ POST request error: %s", e)
                     self._send_json_response(500, {'error': str(e)})
             
             def _send_json_response(self, status_code, data):
                 """Send JSON response"""
-                self.send_response(status_code)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-                self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-                self.end_headers()
-                
-                response_json = json.dumps(data, indent=2)
-                self.wfile.write(response_json.encode('utf-8'))
+                self._send_json_body(status_code, _dumps_json(data))
+            
+            def _send_json_body(self, status_code, body: bytes):
+                """Send an already-serialized JSON response"""
+                # send_header/end_headers followed by a body write costs two
+                # socket writes; build the head here so it is one
+                head = (
+                    f"{self.protocol_version} {status_code} {self.responses[status_code][0]}\r\n"
+                    f"Server: {self.version_string()}\r\n"
+                    f"Date: {self.date_time_string()}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                )
+                self.wfile.write(head.encode('latin-1') + self._CORS_HEADERS + b"\r\n" + body)
+                self.log_request(status_code)
             
             def do_OPTIONS(self):
                 """Handle preflight requests"""
-                self.send_response(200)
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-                self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-                self.end_headers()
+                self.wfile.write(self._OPTIONS_RESPONSE)
+                self.log_request(200)
             
             def log_message(self, format, *args):
                 """Override to use our logger"""
-                logger.info(f"API: {format % args}")
+                # Dashboard polling of /status and /metrics dominates the
+                # request log; keep the log for everything else
+                if args and str(args[0]).startswith(('GET /status', 'GET /metrics')):
+                    return
+                logger.info("API: %s", format % args)
         
         return MissionControlHandler
     
     def _start_performance_monitor(self):
         """Start background performance monitoring"""
         def monitor_performance():
+            last_reflection = None
             while True:
                 try:
                     # Update performance metrics
-                    dashboard_data = self.mission_control.get_mission_control_dashboard()
+                    dashboard_data = self._dashboard()
                     
                     self.performance_metrics['total_missions'] = (
                         dashboard_data['active_missions'] + 
                         dashboard_data['completed_missions']
                     )
                     
-                    # Track consciousness integration
-                    self.cognitive_mirror.reasoning_step("Monitoring mission control performance")
+                    self._publish_snapshot()
                     
-                    if dashboard_data['active_missions'] > 5:
-                        self.cognitive_mirror.uncertainty_peak("High agent load detected")
-                    elif dashboard_data['completed_missions'] > 0:
-                        self.cognitive_mirror.insight_formed("Mission completion rate looks healthy")
+                    # Track consciousness integration at the original slow
+                    # cadence, not on every snapshot
+                    now = time.monotonic()
+                    if last_reflection is None or now - last_reflection >= PERFORMANCE_REFLECT_INTERVAL:
+                        last_reflection = now
+                        self.cognitive_mirror.reasoning_step("Monitoring mission control performance")
+                        
+                        if dashboard_data['active_missions'] > 5:
+                            self.cognitive_mirror.uncertainty_peak("High agent load detected")
+                        elif dashboard_data['completed_missions'] > 0:
+                            self.cognitive_mirror.insight_formed("Mission completion rate looks healthy")
                     
-                    time.sleep(30)  # Monitor every 30 seconds
+                    # Clear before the next render so a change signalled
+                    # while rendering is still picked up by that render
+                    self._state_changed.wait(SNAPSHOT_INTERVAL)
+                    self._state_changed.clear()
                     
                 except Exception as e:
-                    logger.error(f"❌ Performance monitor error: {e}")
+                    logger.error("❌ Performance monitor error: %s", e)
                     time.sleep(60)
         
         monitor_thread = threading.Thread(target=monitor_performance, daemon=True)
@@ -222,8 +458,11 @@ class EnhancedMissionControl:
     
     def spawn_agent_command(self, params: Dict[str, Any]) -> ControlResponse:
         """Handle spawn agent command from dashboard"""
+        now = datetime.now()
         try:
-            mission_type = AgentMissionType(params.get('mission_type', 'research'))
+            mission_type = self._MISSION_TYPES.get(params.get('mission_type', 'research'))
+            if mission_type is None:
+                return ControlResponse.err(f"Unknown mission type: {params.get('mission_type')}", timestamp=now)
             objective = params.get('objective', 'Default mission')
             priority = params.get('priority', 5)
             duration = params.get('duration', 300)  # 5 minutes default
@@ -233,33 +472,15 @@ class EnhancedMissionControl:
             self.cognitive_mirror.reasoning_step(f"Mission objective: {objective}")
             
             # Create and dispatch mission
-            if mission_type == AgentMissionType.RESEARCH:
-                mission = self.mission_control.create_research_mission(objective)
-            elif mission_type == AgentMissionType.DEBUG:
-                mission = self.mission_control.create_debug_mission(objective)
-            elif mission_type == AgentMissionType.ANALYZE:
-                mission = self.mission_control.create_analysis_mission(objective)
-            elif mission_type == AgentMissionType.MONITOR:
-                mission = self.mission_control.create_monitor_mission(objective, duration)
+            factory = self._mission_factories.get(mission_type)
+            if factory is not None:
+                mission = factory(objective, duration)
             else:
-                # Create generic mission
-                from autonomous_agent_loops import AgentMission
-                import uuid
-                mission = AgentMission(
-                    mission_id=f"{mission_type.value}_{uuid.uuid4().hex[:8]}",
-                    mission_type=mission_type,
-                    objective=objective,
-                    parameters={'priority': priority},
-                    expected_duration=duration,
-                    timeout=duration + 60,
-                    priority=priority,
-                    requires_callback=True,
-                    callback_endpoint=None,
-                    created_at=datetime.now()
-                )
+                mission = self._generic_mission(mission_type, objective, priority, duration, now)
             
             # Dispatch the agent
             result = self.mission_control.dispatch_agent(mission)
+            self._notify_state_changed()
             
             if result['success']:
                 self.cognitive_mirror.insight_formed(f"Agent {result['agent_id']} successfully deployed")
@@ -270,14 +491,14 @@ class EnhancedMissionControl:
                     'command': 'spawn_agent',
                     'params': params,
                     'result': result,
-                    'timestamp': datetime.now()
+                    'timestamp': now.isoformat()
                 })
                 
                 return ControlResponse(
                     success=True,
                     data=result,
                     message=f"Agent {result['agent_id']} deployed successfully",
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
             else:
                 self.cognitive_mirror.uncertainty_peak("Failed to deploy agent")
@@ -285,29 +506,46 @@ class EnhancedMissionControl:
                     success=False,
                     data=result,
                     message=f"Failed to deploy agent: {result.get('error', 'Unknown error')}",
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
                 
         except Exception as e:
-            logger.error(f"❌ Spawn agent error: {e}")
+            logger.error("❌ Spawn agent error: %s", e)
             return ControlResponse(
                 success=False,
                 data=None,
                 message=f"Spawn agent failed: {str(e)}",
-                timestamp=datetime.now()
+                timestamp=now
             )
     
+    def _generic_mission(self, mission_type: AgentMissionType, objective: str,
+                         priority: int, duration: int, created_at: datetime) -> AgentMission:
+        """Mission for types without a dedicated mission control constructor"""
+        return AgentMission(
+            mission_id=f"{mission_type.value}_{uuid.uuid4().hex[:8]}",
+            mission_type=mission_type,
+            objective=objective,
+            parameters={'priority': priority},
+            expected_duration=duration,
+            timeout=duration + 60,
+            priority=priority,
+            requires_callback=True,
+            callback_endpoint=None,
+            created_at=created_at
+        )
+    
     def terminate_agent_command(self, params: Dict[str, Any]) -> ControlResponse:
         """Handle terminate agent command"""
+        now = datetime.now()
         try:
             agent_id = params.get('agent_id')
             if not agent_id:
-                return ControlResponse(False, None, "Agent ID required", datetime.now())
+                return ControlResponse.err("Agent ID required", timestamp=now)
             
             self.cognitive_mirror.context_shift(f"Terminating agent {agent_id}")
             
             # Find and terminate agent (simplified for demo)
-            dashboard_data = self.mission_control.get_mission_control_dashboard()
+            dashboard_data = self._dashboard()
             
             terminated = False
             for mission_id, agent_info in dashboard_data.get('agent_status', {}).items():
@@ -319,16 +557,18 @@ class EnhancedMissionControl:
             
             if terminated:
                 self.cognitive_mirror.insight_formed(f"Agent {agent_id} terminated successfully")
-                return ControlResponse(True, {'agent_id': agent_id}, f"Agent {agent_id} terminated", datetime.now())
+                self._notify_state_changed()
+                return ControlResponse.ok({'agent_id': agent_id}, f"Agent {agent_id} terminated", now)
             else:
-                return ControlResponse(False, None, f"Agent {agent_id} not found", datetime.now())
+                return ControlResponse.err(f"Agent {agent_id} not found", timestamp=now)
                 
         except Exception as e:
-            logger.error(f"❌ Terminate agent error: {e}")
-            return ControlResponse(False, None, f"Terminate failed: {str(e)}", datetime.now())
+            logger.error("❌ Terminate agent error: %s", e)
+            return ControlResponse.err(f"Terminate failed: {str(e)}", timestamp=now)
     
     def reconfigure_agent_command(self, params: Dict[str, Any]) -> ControlResponse:
         """Handle reconfigure agent command"""
+        now = datetime.now()
         try:
             agent_id = params.get('agent_id')
             config = params.get('config', {})
@@ -341,20 +581,21 @@ class EnhancedMissionControl:
                 success=True,
                 data={'agent_id': agent_id, 'config': config},
                 message=f"Agent {agent_id} reconfigured",
-                timestamp=datetime.now()
+                timestamp=now
             )
             
         except Exception as e:
-            logger.error(f"❌ Reconfigure agent error: {e}")
-            return ControlResponse(False, None, f"Reconfiguration failed: {str(e)}", datetime.now())
+            logger.error("❌ Reconfigure agent error: %s", e)
+            return ControlResponse.err(f"Reconfiguration failed: {str(e)}", timestamp=now)
     
     def emergency_stop_command(self) -> ControlResponse:
         """Handle emergency stop command"""
+        now = datetime.now()
         try:
             self.cognitive_mirror.context_shift("EMERGENCY STOP initiated")
             self.cognitive_mirror.reasoning_step("Terminating all active agents immediately")
             
-            dashboard_data = self.mission_control.get_mission_control_dashboard()
+            dashboard_data = self._dashboard()
             active_count = dashboard_data['active_agents']
             
             # In a real system, we'd terminate all agent processes
@@ -364,23 +605,25 @@ class EnhancedMissionControl:
             )
             
             self.cognitive_mirror.synthesis_moment(f"Emergency stop completed - system secured")
+            self._notify_state_changed()
             
             return ControlResponse(
                 success=True,
                 data={'terminated_agents': active_count},
                 message=f"Emergency stop executed - {active_count} agents terminated",
-                timestamp=datetime.now()
+                timestamp=now
             )
             
         except Exception as e:
-            logger.error(f"❌ Emergency stop error: {e}")
-            return ControlResponse(False, None, f"Emergency stop failed: {str(e)}", datetime.now())
+            logger.error("❌ Emergency stop error: %s", e)
+            return ControlResponse.err(f"Emergency stop failed: {str(e)}", timestamp=now)
     
     def get_system_status(self) -> ControlResponse:
         """Get overall system status"""
+        now = datetime.now()
         try:
-            dashboard_data = self.mission_control.get_mission_control_dashboard()
-            consciousness_report = self.cognitive_mirror.generate_cognitive_report()
+            dashboard_data = self._dashboard()
+            consciousness_report = self.cognitive_mirror.get_cached_report()
             
             status = {
                 'mission_control': dashboard_data,
@@ -394,50 +637,55 @@ class EnhancedMissionControl:
                 'uptime': time.time() - getattr(self, 'start_time', time.time())
             }
             
-            return ControlResponse(True, status, "System status retrieved", datetime.now())
+            return ControlResponse.ok(status, "System status retrieved", now)
             
         except Exception as e:
-            logger.error(f"❌ Get status error: {e}")
-            return ControlResponse(False, None, f"Status retrieval failed: {str(e)}", datetime.now())
+            logger.error("❌ Get status error: %s", e)
+            return ControlResponse.err(f"Status retrieval failed: {str(e)}", timestamp=now)
     
     def get_missions_data(self) -> ControlResponse:
         """Get missions data for dashboard"""
+        now = datetime.now()
         try:
-            dashboard_data = self.mission_control.get_mission_control_dashboard()
-            return ControlResponse(True, dashboard_data['missions'], "Missions data retrieved", datetime.now())
+            dashboard_data = self._dashboard()
+            return ControlResponse.ok(dashboard_data['missions'], "Missions data retrieved", now)
         except Exception as e:
-            return ControlResponse(False, None, f"Failed to get missions: {str(e)}", datetime.now())
+            return ControlResponse.err(f"Failed to get missions: {str(e)}", timestamp=now)
     
     def get_agents_data(self) -> ControlResponse:
         """Get agents data for dashboard"""
+        now = datetime.now()
         try:
-            dashboard_data = self.mission_control.get_mission_control_dashboard()
-            return ControlResponse(True, dashboard_data['agent_status'], "Agents data retrieved", datetime.now())
+            dashboard_data = self._dashboard()
+            return ControlResponse.ok(dashboard_data['agent_status'], "Agents data retrieved", now)
         except Exception as e:
-            return ControlResponse(False, None, f"Failed to get agents: {str(e)}", datetime.now())
+            return ControlResponse.err(f"Failed to get agents: {str(e)}", timestamp=now)
     
     def get_system_logs(self) -> ControlResponse:
         """Get system logs"""
+        now = datetime.now()
         try:
-            recent_commands = self.command_log[-50:]  # Last 50 commands
-            return ControlResponse(True, recent_commands, "System logs retrieved", datetime.now())
+            recent_commands = list(self.command_log)[-50:]  # Last 50 commands
+            return ControlResponse.ok(recent_commands, "System logs retrieved", now)
         except Exception as e:
-            return ControlResponse(False, None, f"Failed to get logs: {str(e)}", datetime.now())
+            return ControlResponse.err(f"Failed to get logs: {str(e)}", timestamp=now)
     
     def get_performance_metrics(self) -> ControlResponse:
         """Get performance metrics"""
+        now = datetime.now()
         try:
-            return ControlResponse(True, self.performance_metrics, "Performance metrics retrieved", datetime.now())
+            return ControlResponse.ok(self.performance_metrics, "Performance metrics retrieved", now)
         except Exception as e:
-            return ControlResponse(False, None, f"Failed to get metrics: {str(e)}", datetime.now())
+            return ControlResponse.err(f"Failed to get metrics: {str(e)}", timestamp=now)
     
     def get_consciousness_state(self) -> ControlResponse:
         """Get consciousness state"""
+        now = datetime.now()
         try:
-            report = self.cognitive_mirror.generate_cognitive_report()
-            return ControlResponse(True, report, "Consciousness state retrieved", datetime.now())
+            report = self.cognitive_mirror.get_cached_report()
+            return ControlResponse.ok(report, "Consciousness state retrieved", now)
         except Exception as e:
-            return ControlResponse(False, None, f"Failed to get consciousness: {str(e)}", datetime.now())
+            return ControlResponse.err(f"Failed to get consciousness: {str(e)}", timestamp=now)
 
 # Global enhanced mission control instance
 _enhanced_mission_control = None
@@ -0,0 +1,9 @@
+"""
+Compatibility helpers shared by the Cognitive OS modules
+"""
+
+import sys
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+ only);
+# use as @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,55 @@
+"""
+Frame Kernels - compiled pixel reductions for the Enhanced Cognitive Daemon
+
+Per-pixel analysis written in plain Python dominates per-frame time, so the
+reductions live here as Numba kernels over uint8 HxWx3 arrays. New analyses
+(regions of interest, motion detection, ...) should be added as kernels in
+this module rather than as Python loops in the daemon.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _analyze_kernel(arr):
+        h, w, c = arr.shape
+        total = 0.0
+        min_v = 255
+        max_v = 0
+        for y in numba.prange(h):
+            row_total = 0.0
+            row_min = 255
+            row_max = 0
+            for x in range(w):
+                for k in range(c):
+                    v = arr[y, x, k]
+                    row_total += v
+                    if v < row_min:
+                        row_min = v
+                    if v > row_max:
+                        row_max = v
+            total += row_total
+            min_v = min(min_v, row_min)
+            max_v = max(max_v, row_max)
+        return total / (h * w * c), min_v, max_v
+
+
+def analyze(arr: np.ndarray) -> Tuple[float, int, int]:
+    """Return (mean, min, max) channel value of a uint8 HxWxC frame"""
+    if numba is not None:
+        mean, min_v, max_v = _analyze_kernel(np.ascontiguousarray(arr))
+        return float(mean), int(min_v), int(max_v)
+    return float(arr.mean(dtype=np.float64)), int(arr.min()), int(arr.max())
+
+
+def warmup():
+    """Trigger JIT compilation up front so the first real frame doesn't pay for it"""
+    analyze(np.zeros((2, 2, 3), dtype=np.uint8))
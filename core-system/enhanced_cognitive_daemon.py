@@ -9,10 +9,45 @@ import json
 import logging
 import base64
 import time
+import os
+import concurrent.futures
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import io
-from PIL import Image
+import zlib
+import collections
+from PIL import Image, ImageStat
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Compiled reductions; needs NumPy (Numba is optional inside the module)
+    import _frame_kernels
+except ImportError:
+    _frame_kernels = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
 
 # Setup enhanced logging
 logging.basicConfig(
@@ -25,6 +60,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_INV_MB = 1.0 / (1024 * 1024)
+
+_b64decode = pybase64.b64decode if pybase64 is not None else base64.b64decode
+
+# Brightness is spatially smooth: analysing every 4th pixel in each axis gives
+# the same mean while touching 16x less memory
+_BRIGHTNESS_STRIDE = 4
+
+
+# (epoch second, ISO string) of the last wire timestamp that was formatted
+_iso_cache = [None, '']
+
+
+def _now_iso() -> str:
+    """Second-granularity ISO timestamp, reformatted only when the second changes"""
+    now = int(time.time())
+    if now != _iso_cache[0]:
+        _iso_cache[0] = now
+        _iso_cache[1] = datetime.fromtimestamp(now).isoformat()
+    return _iso_cache[1]
+
+
+def _decode_pixels(image, image_data: bytes):
+    """Decode the frame into a uint8 HxWx3 array at 1/_BRIGHTNESS_STRIDE scale"""
+    if cv2 is not None:
+        # libjpeg-turbo scales during the IDCT, so the decoder does less work too
+        arr = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_REDUCED_COLOR_4)
+        if arr is not None:
+            return arr
+    width, height = image.size
+    # For JPEG, draft() makes libjpeg decode at a reduced DCT scale
+    image.draft('RGB', (width // _BRIGHTNESS_STRIDE, height // _BRIGHTNESS_STRIDE))
+    arr = np.asarray(image.convert('RGB'))
+    if image.size == (width, height):
+        # Decoder couldn't scale (non-JPEG); subsample with a strided view instead
+        arr = arr[::_BRIGHTNESS_STRIDE, ::_BRIGHTNESS_STRIDE]
+    return arr
+
+
+def _brightness_stats(image, image_data: bytes) -> float:
+    """Decode the frame and return its mean channel value"""
+    if _frame_kernels is not None:
+        # Only the mean survives the reduced-scale decode; min/max of the
+        # subsampled pixels would understate the frame's real range
+        return _frame_kernels.analyze(_decode_pixels(image, image_data))[0]
+    # ImageStat reduces per-band histograms in C - no per-pixel Python loop
+    return sum(ImageStat.Stat(image).mean) / 3
+
+
+def _frame_fingerprint(image_data: bytes) -> int:
+    """Cheap fingerprint of the compressed frame bytes"""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(image_data)
+    return zlib.crc32(image_data)
+
+
+def _frame_header(image_data: bytes) -> Dict[str, Any]:
+    """Format/mode/size of a frame; parsed inline since no pixels are decoded"""
+    # Image.open only parses the header, so format/mode/size are available
+    # without decoding the pixels. BytesIO over an immutable bytes object
+    # shares its buffer (no copy until written to), so a fresh wrapper per
+    # frame is cheaper than copying into a reused one.
+    image = Image.open(io.BytesIO(image_data))
+    return {
+        'size': image.size,
+        'format': image.format or 'JPEG',
+        'mode': image.mode,
+        'brightness': None
+    }
+
+
+def _sample_brightness(image_data: bytes) -> float:
+    """Decode and reduce a frame in a worker process (must stay picklable)"""
+    return _brightness_stats(Image.open(io.BytesIO(image_data)), image_data)
+
+
 class EnhancedCognitiveDaemon:
     def __init__(self, port=8084):
         self.port = port
@@ -33,6 +144,39 @@ class EnhancedCognitiveDaemon:
         self.total_data_received = 0
         self.session_id = 'enhanced-cognitive-session'
         self.frame_processing_enabled = True
+        self.brightness_sampling_enabled = True
+        self.brightness_sample_rate = 4  # Full-decode every Nth frame
+        self.brightness_ema = None  # Smoothed brightness across sampled frames
+        # Sampled frames are decoded and reduced off the event loop so one
+        # slow frame doesn't stall every other client's websocket traffic
+        self.pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_frame_kernels.warmup if _frame_kernels is not None else None
+        )
+        # Idle screens resend identical frames; they share the last (possibly
+        # still pending) decode instead of running their own
+        self._last_hash = None
+        self._last_decoded = None
+        
+        # Cached avg_frame_size, refreshed every N frames
+        self.stats_refresh_interval = 16
+        self._avg_frame_size = None
+        
+        # Recent frames are summarized in periodic_stats instead of logged one by one
+        self._recent_frames = collections.deque(maxlen=64)
+        
+        # Static parts of the welcome/test payloads are serialized once; only
+        # the dynamic tail is encoded per message
+        self._welcome_prefix = json.dumps({
+            'type': 'welcome',
+            'message': '🧬 Connected to Enhanced Cognitive OS Daemon',
+            'session_id': self.session_id,
+            'capabilities': ['screen_processing', 'frame_analysis', 'real_time_feedback']
+        })[:-1] + ', "timestamp": '
+        self._test_response_prefix = json.dumps({
+            'type': 'test_response',
+            'session_id': self.session_id
+        })[:-1] + ', "message": '
         
         logger.info(f"🧬 Enhanced Cognitive Daemon initializing on port {port}")
         
@@ -43,14 +187,7 @@ class EnhancedCognitiveDaemon:
         logger.info(f"🔗 Client connected: {client_info} (Total clients: {len(self.clients)})")
         
         # Send welcome message
-        welcome_msg = {
-            'type': 'welcome',
-            'message': '🧬 Connected to Enhanced Cognitive OS Daemon',
-            'session_id': self.session_id,
-            'capabilities': ['screen_processing', 'frame_analysis', 'real_time_feedback'],
-            'timestamp': datetime.now().isoformat()
-        }
-        await websocket.send(json.dumps(welcome_msg))
+        await websocket.send(self._welcome_prefix + json.dumps(_now_iso()) + '}')
         
     async def unregister(self, websocket):
         """Unregister a client"""
@@ -58,49 +195,77 @@ class EnhancedCognitiveDaemon:
             self.clients.remove(websocket)
             logger.info(f"🔌 Client disconnected (Remaining clients: {len(self.clients)})")
         
+    async def broadcast(self, message: Dict[str, Any]):
+        """Send one message to every connected client, serializing it once"""
+        if not self.clients:
+            return
+        payload = json.dumps(message)
+        # Snapshot so register/unregister can't mutate the set mid-send
+        await asyncio.gather(*(client.send(payload) for client in list(self.clients)),
+                             return_exceptions=True)
+        
     async def process_screen_frame(self, frame_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process incoming screen frame data"""
         try:
             # Decode base64 image data
-            image_data = base64.b64decode(frame_data['data'])
+            image_data = _b64decode(frame_data['data'], validate=False)
+            size_bytes = len(image_data)
+            # Claim this frame's index before the first await; concurrent
+            # frames must not all read the same count and overwrite each other
+            frames = self.screen_frames_received
+            self.screen_frames_received = frames + 1
+            self.total_data_received += size_bytes
+            brightness_enabled = self.brightness_sampling_enabled
             
-            # Process with PIL for analysis
-            image = Image.open(io.BytesIO(image_data))
-            width, height = image.size
+            # Process with PIL for analysis; sampled frames use the worker pool
+            sample_brightness = brightness_enabled and frames % self.brightness_sample_rate == 0
+            frame_hash = _frame_fingerprint(image_data)
+            if frame_hash == self._last_hash:
+                # Identical to the last frame, whose decode may still be running
+                decoded = dict(await self._last_decoded, brightness=None)
+            else:
+                # Publish the pending decode before awaiting it, so identical
+                # frames arriving meanwhile share it rather than reading a
+                # hash and result that don't match
+                self._last_hash = frame_hash
+                self._last_decoded = pending = asyncio.ensure_future(
+                    self._analyze_frame(image_data, sample_brightness))
+                try:
+                    decoded = await pending
+                except Exception:
+                    if self._last_hash == frame_hash:
+                        self._last_hash = None
+                    raise
+            width, height = decoded['size']
             
             # Basic frame analysis
             analysis = {
                 'frame_number': frame_data.get('frameNumber', 0),
                 'dimensions': f"{width}x{height}",
-                'format': image.format or 'JPEG',
-                'mode': image.mode,
-                'size_bytes': len(image_data),
+                'format': decoded['format'],
+                'mode': decoded['mode'],
+                'size_bytes': size_bytes,
                 'timestamp': frame_data.get('timestamp', time.time() * 1000)
             }
             
             # Advanced analysis (you can add AI processing here)
-            # For now, we'll do basic image statistics
-            if image.mode == 'RGB':
-                # Get basic color statistics
-                pixels = list(image.getdata())
-                avg_brightness = sum(sum(pixel) for pixel in pixels) / (len(pixels) * 3)
-                analysis['avg_brightness'] = round(avg_brightness, 2)
+            # Only sampled frames are fully decoded; the EMA keeps the reported
+            # brightness smooth between samples
+            if brightness_enabled and decoded['mode'] == 'RGB':
+                self._update_brightness(decoded['brightness'])
+                if self.brightness_ema is not None:
+                    analysis['avg_brightness'] = round(self.brightness_ema, 2)
             
-            self.screen_frames_received += 1
-            self.total_data_received += len(image_data)
-            
-            logger.info(f"📺 Processed frame {analysis['frame_number']}: "
-                       f"{analysis['dimensions']}, {analysis['size_bytes']} bytes, "
-                       f"brightness: {analysis.get('avg_brightness', 'N/A')}")
+            self._recent_frames.append((size_bytes, analysis.get('avg_brightness')))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📺 Processed frame {analysis['frame_number']}: "
+                             f"{analysis['dimensions']}, {analysis['size_bytes']} bytes, "
+                             f"brightness: {analysis.get('avg_brightness', 'N/A')}")
             
             return {
                 'type': 'frame_processed',
                 'analysis': analysis,
-                'session_stats': {
-                    'total_frames': self.screen_frames_received,
-                    'total_data_mb': round(self.total_data_received / (1024 * 1024), 2),
-                    'avg_frame_size': round(self.total_data_received / max(self.screen_frames_received, 1), 0)
-                }
+                'session_stats': self._session_stats()
             }
             
         except Exception as e:
@@ -111,28 +276,59 @@ class EnhancedCognitiveDaemon:
                 'frame_number': frame_data.get('frameNumber', 'unknown')
             }
     
+    async def _analyze_frame(self, image_data: bytes, sample_brightness: bool) -> Dict[str, Any]:
+        """Header of a frame, plus its brightness when sampled"""
+        decoded = _frame_header(image_data)
+        # Only a full decode is worth shipping the frame to a worker for;
+        # unsampled frames stop at the header
+        if sample_brightness and decoded['mode'] == 'RGB':
+            decoded['brightness'] = await asyncio.get_running_loop().run_in_executor(
+                self.pool, _sample_brightness, image_data)
+        return decoded
+    
+    def _session_stats(self) -> Dict[str, Any]:
+        """Session totals; only the derived average is refreshed every Nth frame"""
+        frames = self.screen_frames_received
+        if self._avg_frame_size is None or frames % self.stats_refresh_interval == 0:
+            self._avg_frame_size = round(self.total_data_received / max(frames, 1), 0)
+        return {
+            'total_frames': frames,
+            'total_data_mb': round(self.total_data_received * _INV_MB, 2),
+            'avg_frame_size': self._avg_frame_size
+        }
+    
+    def _update_brightness(self, brightness: Optional[float]):
+        """Fold a sampled brightness value into the running EMA"""
+        if brightness is None:
+            return
+        if self.brightness_ema is None:
+            self.brightness_ema = brightness
+        else:
+            self.brightness_ema = 0.9 * self.brightness_ema + 0.1 * brightness
+    
     async def handle_message(self, websocket, message):
         """Handle incoming messages with enhanced processing"""
         try:
+            send = websocket.send
             data = json.loads(message)
             msg_type = data.get('type')
             
-            logger.debug(f"📨 Received message type: {msg_type} from {websocket.remote_address}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📨 Received message type: {msg_type} from {websocket.remote_address}")
             
             if msg_type == 'test':
                 # Enhanced test response
-                response = {
-                    'type': 'test_response',
-                    'message': f"🧬 Enhanced Cognitive OS received: {data.get('message')}",
-                    'session_id': self.session_id,
-                    'timestamp': datetime.now().isoformat(),
-                    'daemon_stats': {
-                        'frames_processed': self.screen_frames_received,
-                        'clients_connected': len(self.clients),
-                        'data_received_mb': round(self.total_data_received / (1024 * 1024), 2)
-                    }
+                daemon_stats = {
+                    'frames_processed': self.screen_frames_received,
+                    'clients_connected': len(self.clients),
+                    'data_received_mb': round(self.total_data_received * _INV_MB, 2)
                 }
-                await websocket.send(json.dumps(response))
+                await send(
+                    self._test_response_prefix
+                    + json.dumps(f"🧬 Enhanced Cognitive OS received: {data.get('message')}")
+                    + ', "timestamp": ' + json.dumps(_now_iso())
+                    + ', "daemon_stats": ' + json.dumps(daemon_stats) + '}'
+                )
                 logger.info(f"📤 Test response sent with stats")
                 
             elif msg_type == 'screen_frame':
@@ -141,12 +337,12 @@ class EnhancedCognitiveDaemon:
                     processing_result = await self.process_screen_frame(data)
                     
                     # Send processing feedback
-                    await websocket.send(json.dumps(processing_result))
+                    await send(json.dumps(processing_result))
                     
                     # Log frame reception
-                    frame_num = data.get('frameNumber', 'unknown')
-                    frame_size = len(message)
-                    logger.info(f"🎬 Frame {frame_num} processed: {frame_size} bytes total message")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        frame_num = data.get('frameNumber', 'unknown')
+                        logger.debug(f"🎬 Frame {frame_num} processed: {len(message)} bytes total message")
                     
                     # TODO: This is where AI processing would happen
                     # You could integrate with Google AI Studio Live API here
@@ -165,9 +361,9 @@ class EnhancedCognitiveDaemon:
                     'type': 'command_result',
                     'command': command,
                     'result': 'Command processing not implemented yet',
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _now_iso()
                 }
-                await websocket.send(json.dumps(response))
+                await send(json.dumps(response))
                 
             else:
                 logger.warning(f"❓ Unknown message type: {msg_type}")
@@ -196,8 +392,15 @@ class EnhancedCognitiveDaemon:
             await asyncio.sleep(30)  # Every 30 seconds
             if self.screen_frames_received > 0:
                 logger.info(f"📊 Stats: {self.screen_frames_received} frames, "
-                           f"{round(self.total_data_received / (1024 * 1024), 2)} MB processed, "
+                           f"{round(self.total_data_received * _INV_MB, 2)} MB processed, "
                            f"{len(self.clients)} clients connected")
+            if self._recent_frames:
+                recent = list(self._recent_frames)
+                self._recent_frames.clear()
+                sizes = [size for size, _ in recent]
+                logger.info(f"📺 Last {len(recent)} frames: "
+                           f"avg {round(sum(sizes) / len(sizes))} bytes, "
+                           f"brightness: {recent[-1][1] if recent[-1][1] is not None else 'N/A'}")
     
     async def start(self):
         """Start the enhanced daemon"""
@@ -208,12 +411,19 @@ class EnhancedCognitiveDaemon:
         stats_task = asyncio.create_task(self.periodic_stats())
         
         try:
-            async with websockets.serve(self.client_handler, "localhost", self.port):
+            # Frames are already-compressed JPEG, so permessage-deflate only
+            # burns CPU; max_queue bounds buffered frames while one is processed
+            async with websockets.serve(self.client_handler, "localhost", self.port,
+                                        compression=None,
+                                        max_size=16 * 1024 * 1024,
+                                        max_queue=8):
                 logger.info(f"✅ Enhanced Cognitive Daemon listening on ws://localhost:{self.port}/ws")
                 await asyncio.Future()  # Run forever
         except Exception as e:
             logger.error(f"❌ Daemon startup failed: {e}")
             stats_task.cancel()
+        finally:
+            self.pool.shutdown(wait=False)
 
 async def main():
     daemon = EnhancedCognitiveDaemon(port=8084)
@@ -222,4 +432,6 @@ async def main():
 if __name__ == "__main__":
     print("🧬 Enhanced Cognitive OS Daemon v0.4")
     print("=" * 50)
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file
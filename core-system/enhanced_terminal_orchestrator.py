@@ -6,30 +6,73 @@ Production-ready terminal management and agent coordination system
 
 import subprocess
 import threading
+import concurrent.futures
+import selectors
 import time
 import json
 import os
 import signal
+import atexit
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Callable, Any, Tuple, Deque
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import psutil
-import queue
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+    import numba
+except ImportError:
+    np = numba = None
 import uuid
+import heapq
+from collections import deque, Counter
+from operator import itemgetter
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] %(levelname)s: %(message)s',
-    handlers=[
-        logging.FileHandler('terminal_orchestra.log'),
-        logging.StreamHandler()
-    ]
-)
+from _compat import DATACLASS_SLOTS
+
+# Configure logging - like basicConfig, only if the root logger is still
+# unconfigured. Records are handed to a QueueListener thread so the monitor
+# and spawn paths only enqueue instead of blocking on file writes.
+_log_listener = None
+if not logging.getLogger().handlers:
+    _log_formatter = logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s')
+    _log_handlers = [logging.FileHandler('terminal_orchestra.log'), logging.StreamHandler()]
+    for _handler in _log_handlers:
+        _handler.setFormatter(_log_formatter)
+    _log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(_log_queue, *_log_handlers)
+    _log_listener.start()
+    # Flush whatever is still queued when the interpreter exits
+    atexit.register(_log_listener.stop)
+    logging.getLogger().addHandler(QueueHandler(_log_queue))
+    logging.getLogger().setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds without activity before a session is reported as hung
+HANG_TIMEOUT_SECONDS = 300
+_NS_PER_SECOND = 1_000_000_000
+
+# Placeholder substituted for {session_id} when pre-rendering command templates
+_SESSION_ID_HOLE = '\0SID\0'
+
+# Most recent terminal output lines kept per session
+OUTPUT_BUFFER_LINES = 1024
+
+# Number of finished sessions kept for inspection
+COMPLETED_HISTORY = 100
+
+# Without SIGCHLD the monitor has to poll for exited agents at this interval
+REAP_POLL_INTERVAL = 5
+
 class AgentType(Enum):
     """Specialized agent types"""
     DEBUG_ASSISTANT = "debug_assistant"
@@ -51,7 +94,7 @@ class TerminalType(Enum):
     TERMINATOR = "terminator"
     TILIX = "tilix"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentConfig:
     """Configuration for cognitive agents"""
     agent_type: AgentType
@@ -63,13 +106,26 @@ class AgentConfig:
     position: tuple = (100, 100)
     color_scheme: str = "default"
     priority: int = 1
-    dependencies: List[str] = None
+    dependencies: List[str] = field(default_factory=list)
+    # command_template pre-rendered around the {session_id} hole
+    _command_parts: List[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if self.dependencies is None:
-            self.dependencies = []
+        self.prerender_command()
+    
+    def prerender_command(self):
+        """Format the per-config fields once so spawns only splice in the session ID"""
+        self._command_parts = self.command_template.format(
+            name=self.name,
+            session_id=_SESSION_ID_HOLE,
+            duration=self.duration
+        ).split(_SESSION_ID_HOLE)
+    
+    def render_command(self, session_id: str) -> str:
+        """Command script for a specific session"""
+        return session_id.join(self._command_parts)
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TerminalSession:
     """Active terminal session tracking"""
     session_id: str
@@ -79,14 +135,76 @@ class TerminalSession:
     start_time: datetime
     terminal_type: TerminalType
     status: str = "running"
-    output_buffer: List[str] = None
+    output_buffer: Deque[str] = None
     last_activity: datetime = None
+    psutil_proc: Optional[psutil.Process] = None
+    # Monotonic clock readings for duration math; the datetimes above are
+    # only for display/serialization
+    start_ns: int = field(default_factory=time.monotonic_ns)
+    last_activity_ns: int = None
+    # Status fields that never change over the session's lifetime
+    _static_status: Dict[str, Any] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.output_buffer is None:
-            self.output_buffer = []
+            # Bounded so long-running agents can't grow RSS without limit;
+            # serialize with list(session.output_buffer)
+            self.output_buffer = deque(maxlen=OUTPUT_BUFFER_LINES)
         if self.last_activity is None:
             self.last_activity = self.start_time
+        if self.last_activity_ns is None:
+            self.last_activity_ns = self.start_ns
+        self._static_status = {
+            'session_id': self.session_id,
+            'agent_type': self.agent_config.agent_type.value,
+            'agent_name': self.agent_config.name,
+            'pid': self.pid,
+            'start_time': self.start_time.isoformat(),
+            'terminal_type': self.terminal_type.value
+        }
+    
+    def touch(self):
+        """Record activity on the session"""
+        self.last_activity = datetime.now()
+        self.last_activity_ns = time.monotonic_ns()
+
+# Below this many sessions the JIT dispatch costs more than the Python sum.
+# Fleets rarely get this big, so the reducer is compiled on first use
+# (cache=True keeps the machine code on disk for later runs)
+_JIT_SESSION_THRESHOLD = 64
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _sum_cpu_mem(cpu, mem):
+        return cpu.sum(), mem.sum()
+else:
+    _sum_cpu_mem = None
+
+
+def _open_wakeup_fd() -> Tuple[int, int]:
+    """Non-blocking (read, write) fds used to wake a selector; one eventfd on Linux"""
+    if hasattr(os, 'eventfd'):
+        fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        return fd, fd
+    r, w = os.pipe()
+    os.set_blocking(r, False)
+    os.set_blocking(w, False)
+    return r, w
+
+
+def _drain_fd(fd: int) -> bytes:
+    """Read everything currently buffered on a non-blocking fd"""
+    chunks = []
+    while True:
+        try:
+            chunk = os.read(fd, 4096)
+        except BlockingIOError:
+            break
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b''.join(chunks)
+
 
 class EnhancedTerminalOrchestrator:
     """
@@ -95,10 +213,24 @@ class EnhancedTerminalOrchestrator:
     """
     
     def __init__(self):
-        self.active_sessions: Dict[str, TerminalSession] = {}
+        # Spawners only insert into _running and the reaper only pops from it;
+        # single-key dict ops are atomic, so neither side iterates a dict the
+        # other is resizing
+        self._running: Dict[str, TerminalSession] = {}
+        self._completed: Deque[TerminalSession] = deque(maxlen=COMPLETED_HISTORY)
+        self._pid_to_session: Dict[int, TerminalSession] = {}
+        self._hang_heap: List[Tuple[int, str]] = []  # (monotonic ns hang deadline, session_id)
+        self._hang_cv = threading.Condition()
+        self._reap_lock = threading.Lock()
         self.agent_configs: Dict[AgentType, AgentConfig] = {}
         self.terminal_types: List[TerminalType] = []
-        self.event_queue = queue.Queue()
+        self._terminal_paths: Dict[TerminalType, str] = {}  # resolved executables
+        # deque.append/popleft are atomic, so producers (including the SIGCHLD
+        # handler) never contend on a queue mutex; a write to the wakeup fd
+        # only wakes the consumer's selector
+        self.event_queue: Deque[Dict[str, Any]] = deque()
+        self._event_r, self._event_w = _open_wakeup_fd()
+        self._signal_r: Optional[int] = None  # read end of signal.set_wakeup_fd()
         self.monitoring_active = False
         self.coordination_rules: Dict[str, Callable] = {}
         
@@ -109,6 +241,11 @@ class EnhancedTerminalOrchestrator:
         
         logger.info("🧬 Enhanced Terminal Orchestrator initialized")
     
+    @property
+    def active_sessions(self) -> Dict[str, TerminalSession]:
+        """Sessions whose process is still running"""
+        return self._running
+    
     def _initialize_system(self):
         """Initialize orchestration system"""
         # Create session directory
@@ -117,11 +254,38 @@ class EnhancedTerminalOrchestrator:
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
+        
+        # Reap finished agents as soon as they exit instead of polling each one
+        if hasattr(signal, 'SIGCHLD'):
+            signal.signal(signal.SIGCHLD, self._sigchld_handler)
+            self._install_signal_wakeup_fd()
+    
+    def _install_signal_wakeup_fd(self):
+        """Route signal arrival straight to the event thread's selector"""
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+        os.set_blocking(w, False)
+        previous = signal.set_wakeup_fd(w)
+        if previous != -1:
+            # Someone else (e.g. an asyncio loop) owns the wakeup fd; keep theirs
+            # and rely on the Python-level handler instead
+            signal.set_wakeup_fd(previous)
+            os.close(r)
+            os.close(w)
+            return
+        self._signal_r = r
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         logger.info(f"🛑 Received signal {signum}, shutting down gracefully...")
         self.shutdown_all_agents()
+    
+    def _sigchld_handler(self, signum, frame):
+        """Hand child-exit notifications to the event thread"""
+        # With our wakeup fd installed, the C-level handler already wrote the
+        # signal number to the event thread's selector
+        if self._signal_r is None:
+            self._post_event({'type': 'sigchld'})
         
     def _load_agent_configs(self):
         """Load predefined agent configurations"""
@@ -333,11 +497,17 @@ read -p 'Press Enter to close security session...'
             TerminalType.TILIX
         ]
         
+        # Stat candidates directly rather than fork/exec'ing `which` per terminal
+        path_dirs = [d for d in os.environ.get('PATH', '').split(os.pathsep) if d]
+        
         for terminal in terminals_to_check:
-            if subprocess.run(['which', terminal.value], 
-                            capture_output=True).returncode == 0:
-                self.terminal_types.append(terminal)
-                logger.info(f"✅ Found terminal: {terminal.value}")
+            for d in path_dirs:
+                candidate = os.path.join(d, terminal.value)
+                if os.access(candidate, os.X_OK):
+                    self.terminal_types.append(terminal)
+                    self._terminal_paths[terminal] = candidate
+                    logger.info(f"✅ Found terminal: {terminal.value}")
+                    break
         
         if not self.terminal_types:
             logger.warning("⚠️ No GUI terminals found, falling back to xterm")
@@ -354,49 +524,134 @@ read -p 'Press Enter to close security session...'
     
     def _monitor_sessions(self):
         """Monitor active terminal sessions"""
+        # With SIGCHLD, exits are reaped from the event thread and this thread
+        # only wakes for the earliest hang deadline
+        poll_for_exits = not hasattr(signal, 'SIGCHLD')
         while self.monitoring_active:
             try:
-                current_time = datetime.now()
-                sessions_to_remove = []
-                
-                for session_id, session in self.active_sessions.items():
-                    # Check if process is still running
-                    if session.process.poll() is not None:
-                        session.status = "completed"
-                        sessions_to_remove.append(session_id)
-                        self._log_session_completion(session)
-                    
-                    # Check for hung processes
-                    elif (current_time - session.last_activity).seconds > 300:  # 5 minutes
-                        logger.warning(f"⚠️ Session {session_id} may be hung")
-                        session.status = "hung"
-                
-                # Clean up completed sessions
-                for session_id in sessions_to_remove:
-                    del self.active_sessions[session_id]
+                with self._hang_cv:
+                    timeout = None
+                    if self._hang_heap:
+                        timeout = max(self._hang_heap[0][0] - time.monotonic_ns(), 0) / _NS_PER_SECOND
+                    if poll_for_exits:
+                        timeout = min(timeout if timeout is not None else REAP_POLL_INTERVAL,
+                                      REAP_POLL_INTERVAL)
+                    if timeout is None or timeout > 0:
+                        self._hang_cv.wait(timeout)
                 
-                time.sleep(5)  # Check every 5 seconds
+                if poll_for_exits:
+                    self._reap_completed_sessions()
+                self._check_hung_sessions()
                 
             except Exception as e:
                 logger.error(f"❌ Monitor error: {e}")
                 time.sleep(10)
     
+    def _reap_completed_sessions(self):
+        """Retire sessions whose process has exited"""
+        # Only our own pids are waited on (Popen.poll() is a WNOHANG waitpid on
+        # that pid); children started elsewhere in this process, e.g. by
+        # subprocess.run(), are left for their owners to reap
+        with self._reap_lock:
+            for session in list(self._pid_to_session.values()):
+                if session.process.poll() is not None:
+                    self._complete_session(session)
+    
+    def _complete_session(self, session: TerminalSession):
+        """Move a finished session from _running to _completed"""
+        # The pop is the claim: whoever removes it first does the bookkeeping
+        if self._running.pop(session.session_id, None) is None:
+            return
+        session.status = "completed"
+        session.psutil_proc = None
+        self._pid_to_session.pop(session.pid, None)
+        self._completed.append(session)
+        self._log_session_completion(session)
+    
+    def _check_hung_sessions(self):
+        """Flag sessions idle past HANG_TIMEOUT_SECONDS, looking only at due deadlines"""
+        now = time.monotonic_ns()
+        with self._hang_cv:
+            while self._hang_heap and self._hang_heap[0][0] <= now:
+                _, session_id = heapq.heappop(self._hang_heap)
+                session = self._running.get(session_id)
+                if session is None:
+                    continue
+                
+                deadline = session.last_activity_ns + HANG_TIMEOUT_SECONDS * _NS_PER_SECOND
+                if deadline > now:
+                    # Activity since this entry was queued; reschedule
+                    heapq.heappush(self._hang_heap, (deadline, session_id))
+                else:
+                    logger.warning(f"⚠️ Session {session_id} may be hung")
+                    session.status = "hung"
+    
+    def _schedule_hang_check(self, session: TerminalSession):
+        """Queue the session's hang deadline and wake the monitor if it is now earliest"""
+        with self._hang_cv:
+            heapq.heappush(self._hang_heap, (
+                session.last_activity_ns + HANG_TIMEOUT_SECONDS * _NS_PER_SECOND, session.session_id
+            ))
+            self._hang_cv.notify()
+    
+    def _post_event(self, event: Dict[str, Any]):
+        """Queue a coordination event for the event thread"""
+        self.event_queue.append(event)
+        self._wake_event_thread()
+    
+    def _wake_event_thread(self):
+        """Make the event thread's selector return"""
+        try:
+            if self._event_r == self._event_w:
+                os.eventfd_write(self._event_w, 1)
+            else:
+                os.write(self._event_w, b'\0')
+        except BlockingIOError:
+            pass  # Already signalled and not yet drained
+    
     def _process_events(self):
         """Process coordination events"""
-        while self.monitoring_active:
-            try:
-                event = self.event_queue.get(timeout=1)
-                self._handle_coordination_event(event)
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error(f"❌ Event processing error: {e}")
+        # Blocks in the kernel with no timeout: idle costs no wakeups at all
+        selector = selectors.DefaultSelector()
+        selector.register(self._event_r, selectors.EVENT_READ, 'events')
+        if self._signal_r is not None:
+            selector.register(self._signal_r, selectors.EVENT_READ, 'signals')
+        
+        try:
+            while self.monitoring_active:
+                for key, _ in selector.select():
+                    received = _drain_fd(key.fd)
+                    if key.data == 'signals' and signal.SIGCHLD in received:
+                        self.event_queue.append({'type': 'sigchld'})
+                
+                while True:
+                    try:
+                        event = self.event_queue.popleft()
+                    except IndexError:
+                        break
+                    try:
+                        self._handle_coordination_event(event)
+                    except Exception as e:
+                        logger.error(f"❌ Event processing error: {e}")
+        finally:
+            selector.close()
     
     def _handle_coordination_event(self, event):
         """Handle agent coordination events"""
         event_type = event.get('type')
         
-        if event_type == 'agent_complete':
+        # Any event from an agent counts as activity; its heap entry is
+        # rescheduled lazily when the old deadline comes due
+        session = self._running.get(event.get('session_id'))
+        if session is not None:
+            session.touch()
+            if session.status == "hung":
+                session.status = "running"
+                self._schedule_hang_check(session)
+        
+        if event_type == 'sigchld':
+            self._reap_completed_sessions()
+        elif event_type == 'agent_complete':
             self._handle_agent_completion(event)
         elif event_type == 'dependency_ready':
             self._handle_dependency_ready(event)
@@ -429,6 +684,8 @@ read -p 'Press Enter to close security session...'
                 for key, value in custom_config.items():
                     if hasattr(config, key):
                         setattr(config, key, value)
+                if {'command_template', 'name', 'duration'} & custom_config.keys():
+                    config.prerender_command()
             
             # Generate session ID
             session_id = f"{agent_type.value}_{uuid.uuid4().hex[:8]}"
@@ -437,11 +694,7 @@ read -p 'Press Enter to close security session...'
             terminal_type = terminal_preference or self.terminal_types[0]
             
             # Build command
-            command_script = config.command_template.format(
-                name=config.name,
-                session_id=session_id,
-                duration=config.duration
-            )
+            command_script = config.render_command(session_id)
             
             # Spawn terminal based on type
             process = self._spawn_terminal_process(
@@ -455,11 +708,19 @@ read -p 'Press Enter to close security session...'
                 process=process,
                 pid=process.pid,
                 start_time=datetime.now(),
-                terminal_type=terminal_type
+                terminal_type=terminal_type,
+                psutil_proc=self._open_psutil_process(process.pid)
             )
             
             # Store session
-            self.active_sessions[session_id] = session
+            self._running[session_id] = session
+            with self._reap_lock:
+                self._pid_to_session[process.pid] = session
+                # Its SIGCHLD may already have been handled before the pid was
+                # registered; check once now that the reaper can see it
+                if process.poll() is not None:
+                    self._complete_session(session)
+            self._schedule_hang_check(session)
             
             # Log spawn event
             logger.info(f"🚀 Spawned {config.name} (ID: {session_id}, PID: {process.pid})")
@@ -484,6 +745,17 @@ read -p 'Press Enter to close security session...'
                 'agent_type': agent_type.value
             }
     
+    @staticmethod
+    def _open_psutil_process(pid: int) -> Optional[psutil.Process]:
+        """Open a reusable psutil handle with its CPU baseline primed"""
+        try:
+            proc = psutil.Process(pid)
+            # First cpu_percent() call only records the baseline
+            proc.cpu_percent(None)
+            return proc
+        except psutil.NoSuchProcess:
+            return None
+    
     def _spawn_terminal_process(self, terminal_type: TerminalType, 
                               session_id: str, config: AgentConfig,
                               command_script: str) -> subprocess.Popen:
@@ -493,7 +765,7 @@ read -p 'Press Enter to close security session...'
         
         if terminal_type == TerminalType.GNOME_TERMINAL:
             cmd = [
-                'gnome-terminal',
+                self._terminal_paths.get(terminal_type, 'gnome-terminal'),
                 '--window',
                 '--title', f'🧬 {config.name} [{session_id}]',
                 '--geometry', f'{config.geometry}+{x}+{y}',
@@ -503,7 +775,7 @@ read -p 'Press Enter to close security session...'
         
         elif terminal_type == TerminalType.XTERM:
             cmd = [
-                'xterm',
+                self._terminal_paths.get(TerminalType.XTERM, 'xterm'),
                 '-title', f'🧬 {config.name} [{session_id}]',
                 '-geometry', f'{config.geometry}+{x}+{y}',
                 '-e', 'bash', '-c', command_script
@@ -511,7 +783,7 @@ read -p 'Press Enter to close security session...'
         
         elif terminal_type == TerminalType.KONSOLE:
             cmd = [
-                'konsole',
+                self._terminal_paths.get(terminal_type, 'konsole'),
                 '--new-tab',
                 '--title', f'🧬 {config.name} [{session_id}]',
                 '-e', 'bash', '-c', command_script
@@ -520,22 +792,29 @@ read -p 'Press Enter to close security session...'
         else:
             # Fallback to xterm
             cmd = [
-                'xterm',
+                self._terminal_paths.get(TerminalType.XTERM, 'xterm'),
                 '-title', f'🧬 {config.name} [{session_id}]',
                 '-geometry', f'{config.geometry}+{x}+{y}',
                 '-e', 'bash', '-c', command_script
             ]
         
-        return subprocess.Popen(cmd)
+        # An absolute executable with close_fds=False lets CPython use
+        # posix_spawn (vfork-backed) instead of fork+exec; our own fds are
+        # non-inheritable/CLOEXEC so nothing leaks into the terminal
+        return subprocess.Popen(cmd, close_fds=False)
     
     def spawn_agent_team(self, agent_types: List[AgentType], 
                         coordination_delay: int = 2) -> Dict[str, Any]:
         """
         Spawn a coordinated team of agents
         
+        Agents are spawned concurrently; only agents whose config lists
+        another team member in `dependencies` wait for that member.
+        
         Args:
             agent_types: List of agent types to spawn
-            coordination_delay: Delay between spawns for coordination
+            coordination_delay: Delay before spawning agents that depend on
+                earlier team members
             
         Returns:
             Dictionary with team spawn results
@@ -550,30 +829,57 @@ read -p 'Press Enter to close security session...'
         
         logger.info(f"🎯 Spawning agent team: {[at.value for at in agent_types]}")
         
-        for i, agent_type in enumerate(agent_types):
-            # Spawn agent
-            result = self.spawn_agent(agent_type)
-            team_results['agents'].append(result)
-            
-            if not result['success']:
-                team_results['success'] = False
-                logger.error(f"❌ Team spawn failed at {agent_type.value}")
-                break
-            
-            # Coordination delay (except for last agent)
-            if i < len(agent_types) - 1:
-                time.sleep(coordination_delay)
+        results: Dict[int, Dict[str, Any]] = {}
+        pending = list(enumerate(agent_types))
+        spawned_types = set()
+        team_values = {agent_type.value for agent_type in agent_types}
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(agent_types), 1)) as executor:
+            while pending:
+                # Every agent whose in-team dependencies are already up goes in this wave
+                wave = [(i, agent_type) for i, agent_type in pending
+                        if self._team_dependencies(agent_type, team_values) <= spawned_types]
+                if not wave:
+                    logger.warning("⚠️ Unresolvable agent dependencies, spawning remaining agents")
+                    wave = pending
+                if results:
+                    time.sleep(coordination_delay)
+                
+                for (i, agent_type), result in zip(wave, executor.map(
+                        lambda item: self.spawn_agent(item[1]), wave)):
+                    results[i] = result
+                    if result['success']:
+                        spawned_types.add(agent_type.value)
+                    else:
+                        team_results['success'] = False
+                        logger.error(f"❌ Team spawn failed at {agent_type.value}")
+                
+                if not team_results['success']:
+                    break
+                wave_indices = {i for i, _ in wave}
+                pending = [item for item in pending if item[0] not in wave_indices]
+        
+        team_results['agents'] = [results[i] for i in sorted(results)]
         
         logger.info(f"🎯 Team spawn complete: {team_results['team_id']}")
         return team_results
     
+    def _team_dependencies(self, agent_type: AgentType, team_values: set) -> set:
+        """Dependencies of an agent that are part of the team being spawned"""
+        config = self.agent_configs.get(agent_type)
+        if config is None:
+            return set()
+        return set(config.dependencies) & team_values
+    
     def get_session_status(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed status of a session"""
-        if session_id not in self.active_sessions:
+        session = self._running.get(session_id)
+        if session is None:
             return None
-        
-        session = self.active_sessions[session_id]
-        
+        return self._session_status(session)
+    
+    def _session_status(self, session: TerminalSession) -> Dict[str, Any]:
+        """Build the status dict for a session"""
         # Check process status
         is_running = session.process.poll() is None
         
@@ -583,42 +889,35 @@ read -p 'Press Enter to close security session...'
         
         if is_running:
             try:
-                process = psutil.Process(session.pid)
-                cpu_percent = process.cpu_percent()
-                memory_mb = process.memory_info().rss / 1024 / 1024
+                if session.psutil_proc is None:
+                    raise psutil.NoSuchProcess(session.pid)
+                # oneshot() reads /proc/<pid>/stat once for both samples
+                with session.psutil_proc.oneshot():
+                    cpu_percent = session.psutil_proc.cpu_percent(None)
+                    memory_mb = session.psutil_proc.memory_info().rss / (1 << 20)
             except psutil.NoSuchProcess:
                 is_running = False
         
-        return {
-            'session_id': session_id,
-            'agent_type': session.agent_config.agent_type.value,
-            'agent_name': session.agent_config.name,
-            'pid': session.pid,
+        status = session._static_status.copy()
+        status.update({
             'status': 'running' if is_running else 'completed',
-            'start_time': session.start_time.isoformat(),
-            'duration_seconds': (datetime.now() - session.start_time).seconds,
-            'terminal_type': session.terminal_type.value,
+            'duration_seconds': (time.monotonic_ns() - session.start_ns) // _NS_PER_SECOND,
             'cpu_percent': cpu_percent,
             'memory_mb': memory_mb,
             'last_activity': session.last_activity.isoformat()
-        }
+        })
+        return status
     
     def list_active_sessions(self) -> List[Dict[str, Any]]:
         """List all active sessions with status"""
-        sessions = []
-        for session_id in self.active_sessions:
-            status = self.get_session_status(session_id)
-            if status:
-                sessions.append(status)
-        return sessions
+        return [self._session_status(session) for session in list(self._running.values())]
     
     def terminate_session(self, session_id: str, graceful: bool = True) -> bool:
         """Terminate a specific session"""
-        if session_id not in self.active_sessions:
+        session = self._running.get(session_id)
+        if session is None:
             return False
         
-        session = self.active_sessions[session_id]
-        
         try:
             if graceful:
                 # Send SIGTERM first
@@ -630,12 +929,15 @@ read -p 'Press Enter to close security session...'
                 except subprocess.TimeoutExpired:
                     # Force kill if didn't shutdown gracefully
                     session.process.kill()
+                    session.process.wait()
             else:
                 # Immediate force kill
                 session.process.kill()
+                session.process.wait()
             
-            # Remove from active sessions
-            del self.active_sessions[session_id]
+            # Remove from active sessions (the reaper may have beaten us to it)
+            self._running.pop(session_id, None)
+            self._pid_to_session.pop(session.pid, None)
             logger.info(f"🛑 Terminated session: {session_id}")
             return True
             
@@ -647,33 +949,40 @@ read -p 'Press Enter to close security session...'
         """Gracefully shutdown all active agents"""
         logger.info("🛑 Shutting down all active agents...")
         
-        session_ids = list(self.active_sessions.keys())
+        session_ids = list(self._running.keys())
         for session_id in session_ids:
             self.terminate_session(session_id, graceful=True)
         
         self.monitoring_active = False
+        with self._hang_cv:
+            self._hang_cv.notify()
+        self._wake_event_thread()
         logger.info("✅ All agents shutdown complete")
     
     def _log_session_completion(self, session: TerminalSession):
         """Log session completion details"""
-        duration = datetime.now() - session.start_time
+        duration_seconds = (time.monotonic_ns() - session.start_ns) // _NS_PER_SECOND
         
         log_entry = {
             'session_id': session.session_id,
             'agent_type': session.agent_config.agent_type.value,
             'agent_name': session.agent_config.name,
             'start_time': session.start_time.isoformat(),
-            'duration_seconds': duration.seconds,
+            'duration_seconds': duration_seconds,
             'completion_time': datetime.now().isoformat(),
             'status': 'completed_successfully'
         }
         
-        # Save to session log
+        # Save to session log - serialize up front so the file gets one write
+        if orjson is not None:
+            data = orjson.dumps(log_entry, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(log_entry, indent=2).encode('utf-8')
         log_file = f"terminal_sessions/session_{session.session_id}.json"
-        with open(log_file, 'w') as f:
-            json.dump(log_entry, f, indent=2)
+        with open(log_file, 'wb') as f:
+            f.write(data)
         
-        logger.info(f"✅ {session.agent_config.name} completed ({duration.seconds}s)")
+        logger.info(f"✅ {session.agent_config.name} completed ({duration_seconds}s)")
     
     def _check_dependencies(self, config: AgentConfig, session_id: str):
         """Check and handle agent dependencies"""
@@ -688,17 +997,18 @@ read -p 'Press Enter to close security session...'
         """Generate comprehensive dashboard report"""
         active_sessions = self.list_active_sessions()
         
-        # Calculate statistics
+        # Calculate statistics - Counter/sum(map()) keep the loops in C
         total_sessions = len(active_sessions)
-        agent_types = {}
-        total_cpu = 0.0
-        total_memory = 0.0
-        
-        for session in active_sessions:
-            agent_type = session['agent_type']
-            agent_types[agent_type] = agent_types.get(agent_type, 0) + 1
-            total_cpu += session['cpu_percent']
-            total_memory += session['memory_mb']
+        agent_types = dict(Counter(map(itemgetter('agent_type'), active_sessions)))
+        if _sum_cpu_mem is not None and total_sessions >= _JIT_SESSION_THRESHOLD:
+            cpu = np.fromiter(map(itemgetter('cpu_percent'), active_sessions),
+                              dtype=np.float64, count=total_sessions)
+            memory = np.fromiter(map(itemgetter('memory_mb'), active_sessions),
+                                 dtype=np.float64, count=total_sessions)
+            total_cpu, total_memory = (float(total) for total in _sum_cpu_mem(cpu, memory))
+        else:
+            total_cpu = sum(map(itemgetter('cpu_percent'), active_sessions))
+            total_memory = sum(map(itemgetter('memory_mb'), active_sessions))
         
         return {
             'timestamp': datetime.now().isoformat(),
@@ -716,12 +1026,17 @@ read -p 'Press Enter to close security session...'
 
 # Global orchestrator instance
 _orchestrator_instance = None
+_orchestrator_lock = threading.Lock()
 
 def get_orchestrator() -> EnhancedTerminalOrchestrator:
     """Get global orchestrator instance"""
     global _orchestrator_instance
+    # Double-checked locking: the unlocked fast path covers every call after
+    # the first, the re-check stops concurrent first callers building two
     if _orchestrator_instance is None:
-        _orchestrator_instance = EnhancedTerminalOrchestrator()
+        with _orchestrator_lock:
+            if _orchestrator_instance is None:
+                _orchestrator_instance = EnhancedTerminalOrchestrator()
     return _orchestrator_instance
 
 # Convenience functions for easy integration
@@ -8,24 +8,80 @@ import asyncio
 import json
 import os
 import re
+import sys
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 import threading
 import websockets
 
-@dataclass 
+from _compat import DATACLASS_SLOTS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+# the stdlib exception either way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Sort order of suggestion priorities; unknown priorities sort last
+PRIORITY_RANK = {'high': 0, 'medium': 1, 'low': 2}
+
+# ANSI cursor home + clear to end of screen
+CLEAR_SCREEN = "\x1b[H\x1b[J"
+
+# Distinct development contexts whose suggestions are kept for reuse
+SUGGESTION_CACHE_SIZE = 32
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DevelopmentContext:
-    """Current development context from screen"""
+    """Current development context from screen (immutable, so usable as a cache key)"""
     current_file: Optional[str] = None
     visible_code: Optional[str] = None
-    error_messages: List[str] = None
-    terminal_commands: List[str] = None
-    todos_visible: List[str] = None
+    error_messages: Tuple[str, ...] = ()
+    terminal_commands: Tuple[str, ...] = ()
+    todos_visible: Tuple[str, ...] = ()
     git_status: Optional[str] = None
     language: Optional[str] = None
     framework: Optional[str] = None
 
+# Context the demo "detects" on screen; built once, frozen, and shared
+_DEMO_CONTEXT = DevelopmentContext(
+    current_file="example_module.py",
+    visible_code='''def calculate_total(items):
+    total = 0
+    for item in items:
+        total += item.price * item.quantity
+    return total
+
+def process_order(order_data):
+    # TODO: Add validation for order_data
+    items = order_data.get('items', [])
+    total = calculate_total(items)
+    
+    if total > 1000:
+        # FIXME: Apply discount logic here
+        pass
+    
+    return {
+        'order_id': order_data['id'],
+        'total': total,
+        'status': 'processed'
+    }''',
+    error_messages=("AttributeError: 'dict' object has no attribute 'price'",),
+    todos_visible=("TODO: Add validation for order_data", "FIXME: Apply discount logic here"),
+    language="python",
+    framework="flask"
+)
+
 class InlineCognitiveAssistant:
     """
     Provides inline assistance during development by monitoring screen context
@@ -38,9 +94,20 @@ class InlineCognitiveAssistant:
         self.automated_tasks = []
         self.screen_analyzer_active = False
         self.ws_connection = None
+        # _scan_context() hits for current_context.visible_code, refreshed
+        # when the context changes rather than rescanned on every tick
+        self._code_hits: Dict[str, List[str]] = {}
+        # frameNumber of the last frame analyzed
+        self._last_frame_number: Optional[int] = None
+        # context -> suggestions built for it, least recently used first
+        self._suggestion_cache: "OrderedDict[DevelopmentContext, List[Dict]]" = OrderedDict()
+        # On a terminal, redraw the suggestion panel in place instead of
+        # scrolling a new copy; piped output keeps the plain append-only log
+        self._redraw_in_place = sys.stdout.isatty()
         
-        # Patterns for context detection
-        self.patterns = {
+        # Patterns for context detection, compiled once rather than on use
+        # (MULTILINE so import_pattern's ^ anchors on each line of a buffer)
+        raw_patterns = {
             'python_file': r'\.py\b',
             'javascript_file': r'\.(js|jsx|ts|tsx)\b',
             'error_pattern': r'(Error:|Exception:|Failed|TypeError|undefined)',
@@ -48,8 +115,11 @@ class InlineCognitiveAssistant:
             'import_pattern': r'^(import|from|require|using)\s+',
             'function_pattern': r'(def|function|const|let|var)\s+(\w+)\s*[=(]',
             'class_pattern': r'class\s+(\w+)',
-            'test_pattern': r'(test_|_test\.py|\.test\.|describe\(|it\()'
+            'test_pattern': r'(test_|_test\.py|\.test\.|describe\(|it\()',
+            'return_annotation': r'->'
         }
+        self.patterns = {name: re.compile(pattern, re.MULTILINE)
+                         for name, pattern in raw_patterns.items()}
         
     async def start_inline_assistance(self):
         """Start inline cognitive assistance"""
@@ -77,80 +147,134 @@ class InlineCognitiveAssistant:
         # Start analysis loop
         await self._analysis_loop()
     
+    def _scan_context(self, text: str) -> Dict[str, List[str]]:
+        """Pattern hits in text, keyed by pattern name"""
+        # Each pattern gets its own pass: hits of different patterns overlap
+        # (todo_pattern's (.+) runs to the end of the line), which a single
+        # alternation would report as one match
+        hits: Dict[str, List[str]] = {}
+        for name, pattern in self.patterns.items():
+            found = [match.group() for match in pattern.finditer(text)]
+            if found:
+                hits[name] = found
+        return hits
+    
     async def _connect_to_cognitive_os(self):
         """Connect to Cognitive OS for screen data"""
-        self.ws_connection = await websockets.connect('ws://localhost:8084/ws')
+        # Frames are already-compressed JPEG, so permessage-deflate only burns
+        # CPU; accept frames as large as the daemon does, and keep at most two
+        # buffered since only the newest is analyzed anyway. The daemon's
+        # server already pings this connection, so skip a client keepalive
+        self.ws_connection = await websockets.connect('ws://localhost:8084/ws',
+                                                      compression=None,
+                                                      max_size=16 * 1024 * 1024,
+                                                      max_queue=2,
+                                                      ping_interval=None,
+                                                      ping_timeout=None)
         print("✅ Connected to Cognitive OS screen stream")
     
     async def _analysis_loop(self):
         """Main analysis loop processing screen frames"""
-        frame_count = 0
-        last_analysis_time = 0
+        # Frames due for analysis. Only the newest is kept, so an analysis
+        # that overruns the frame interval never leaves a backlog of stale
+        # frames (or their memory) behind it
+        frames: asyncio.Queue = asyncio.Queue(maxsize=1)
+        processor = asyncio.create_task(self._process_frames(frames))
+        try:
+            await self._read_frames(frames)
+        finally:
+            processor.cancel()
+    
+    async def _read_frames(self, frames: asyncio.Queue):
+        """Drain the screen stream, handing throttled frames to the processor"""
+        last_analysis_time = float('-inf')
         analysis_interval = 2.0  # Analyze every 2 seconds
         
         async for message in self.ws_connection:
+            # Only screen frames are analyzed; skip anything else without
+            # parsing it (the marker is looked for anywhere, since the
+            # sender's key order isn't fixed)
+            marker = b'"screen_frame"' if isinstance(message, bytes) else '"screen_frame"'
+            if marker not in message:
+                continue
             try:
-                data = json.loads(message)
+                data = _json_loads(message)
                 
                 if data.get('type') == 'screen_frame':
-                    frame_count += 1
-                    
-                    # Throttle analysis to avoid overload
-                    current_time = time.time()
+                    # Throttle analysis to avoid overload (the first frame is
+                    # analyzed right away)
+                    current_time = time.monotonic()
                     if current_time - last_analysis_time >= analysis_interval:
-                        # In real implementation, would use OCR/AI vision
-                        # For now, simulate context analysis
-                        await self._analyze_development_context(data)
                         last_analysis_time = current_time
-                        
-                        # Provide inline suggestions
-                        await self._provide_inline_suggestions()
+                        # Drop the frame still waiting, if any
+                        if frames.full():
+                            frames.get_nowait()
+                        frames.put_nowait(data)
                         
             except json.JSONDecodeError:
                 continue
             except Exception as e:
                 print(f"❌ Analysis error: {e}")
     
+    async def _process_frames(self, frames: asyncio.Queue):
+        """Analyze frames handed over by _read_frames"""
+        while True:
+            data = await frames.get()
+            try:
+                # In real implementation, would use OCR/AI vision
+                # For now, simulate context analysis
+                await self._analyze_development_context(data)
+                
+                # Provide inline suggestions
+                await self._provide_inline_suggestions()
+            except KeyError as e:
+                # Frames are indexed directly; one malformed frame is skipped
+                # here rather than defaulting every field lookup
+                print(f"❌ Screen frame missing field: {e}")
+            except Exception as e:
+                print(f"❌ Analysis error: {e}")
+    
     async def _analyze_development_context(self, frame_data: Dict):
         """Analyze screen frame to extract development context"""
         # In production, this would use AI vision to read the screen
         # For demonstration, we'll simulate detected context
         
         # Simulate detecting a Python file with an error
-        if frame_data.get('frameNumber', 0) % 10 == 0:
-            self.current_context = DevelopmentContext(
-                current_file="example_module.py",
-                visible_code='''def calculate_total(items):
-    total = 0
-    for item in items:
-        total += item.price * item.quantity
-    return total
-
-def process_order(order_data):
-    # TODO: Add validation for order_data
-    items = order_data.get('items', [])
-    total = calculate_total(items)
-    
-    if total > 1000:
-        # FIXME: Apply discount logic here
-        pass
-    
-    return {
-        'order_id': order_data['id'],
-        'total': total,
-        'status': 'processed'
-    }''',
-                error_messages=["AttributeError: 'dict' object has no attribute 'price'"],
-                todos_visible=["TODO: Add validation for order_data", "FIXME: Apply discount logic here"],
-                language="python",
-                framework="flask"
-            )
+        # Analysis samples the stream, so the frame numbered 10, 20, ... itself
+        # is rarely the one analyzed; react once one has gone by since the last
+        frame_number = frame_data['frameNumber']
+        last_frame_number = self._last_frame_number
+        self._last_frame_number = frame_number
+        passed_tenth = frame_number % 10 == 0 or (
+            last_frame_number is not None and frame_number // 10 > last_frame_number // 10)
+        if passed_tenth and self.current_context is not _DEMO_CONTEXT:
+            self.current_context = _DEMO_CONTEXT
+            self._code_hits = self._scan_context(_DEMO_CONTEXT.visible_code)
     
     async def _provide_inline_suggestions(self):
         """Provide context-aware inline suggestions"""
-        if not self.current_context.current_file:
+        context = self.current_context
+        if not context.current_file:
+            return
+        
+        # The context changes far less often than this runs; reuse the
+        # suggestions already built for it
+        suggestions = self._suggestion_cache.get(context)
+        if suggestions is not None:
+            self._suggestion_cache.move_to_end(context)
+            # Already on screen unless the context changed back to this one
+            if suggestions is not self.suggestions_queue:
+                self._show_suggestions(suggestions)
             return
         
+        suggestions = self._build_suggestions()
+        self._suggestion_cache[context] = suggestions
+        if len(self._suggestion_cache) > SUGGESTION_CACHE_SIZE:
+            self._suggestion_cache.popitem(last=False)
+        self._show_suggestions(suggestions)
+    
+    def _build_suggestions(self) -> List[Dict]:
+        """Suggestions for the current context, highest priority first"""
         suggestions = []
         
         # Analyze for errors
@@ -209,8 +333,8 @@ total += item.get('price', 0) * item.get('quantity', 0)'''
                 })
             
             # Suggest type hints
-            if self.current_context.language == 'python' and 'def ' in self.current_context.visible_code:
-                if '->' not in self.current_context.visible_code:
+            if self.current_context.language == 'python' and 'function_pattern' in self._code_hits:
+                if 'return_annotation' not in self._code_hits:
                     suggestions.append({
                         'type': 'enhancement',
                         'priority': 'low',
@@ -219,48 +343,61 @@ total += item.get('price', 0) * item.get('quantity', 0)'''
                         'example': 'def calculate_total(items: List[Dict[str, float]]) -> float:'
                     })
         
-        # Display suggestions
+        # Split code blocks once here rather than on every display, and order
+        # by priority: with a fixed handful of levels, bucketing is a single
+        # stable pass with no comparisons
+        buckets = [[] for _ in range(len(PRIORITY_RANK) + 1)]
+        for suggestion in suggestions:
+            for field in ('code_fix', 'code_suggestion'):
+                if field in suggestion:
+                    suggestion[f'{field}_lines'] = suggestion[field].split('\n')
+            buckets[PRIORITY_RANK.get(suggestion['priority'], len(PRIORITY_RANK))].append(suggestion)
+        
+        return [suggestion for bucket in buckets for suggestion in bucket]
+    
+    def _show_suggestions(self, suggestions: List[Dict]):
+        """Display suggestions and queue them for execution"""
         if suggestions:
-            print("\n" + "="*60)
-            print("🤖 INLINE SUGGESTIONS BASED ON SCREEN CONTEXT")
-            print("="*60)
-            
-            # Sort by priority
-            priority_order = {'high': 0, 'medium': 1, 'low': 2}
-            suggestions.sort(key=lambda x: priority_order.get(x['priority'], 3))
+            # Build the whole block and write it at once rather than a
+            # print (and stdout lock) per line
+            buf = [CLEAR_SCREEN if self._redraw_in_place else "\n", "=" * 60, "\n",
+                   "🤖 INLINE SUGGESTIONS BASED ON SCREEN CONTEXT\n",
+                   "=" * 60, "\n"]
             
             for i, suggestion in enumerate(suggestions, 1):
-                self._display_suggestion(i, suggestion)
+                self._display_suggestion(i, suggestion, buf)
                 
-            print("="*60)
+            buf.append("=" * 60 + "\n")
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
             
             # Store for potential automated execution
             self.suggestions_queue = suggestions
     
-    def _display_suggestion(self, index: int, suggestion: Dict):
-        """Display a formatted suggestion"""
+    def _display_suggestion(self, index: int, suggestion: Dict, buf: List[str]):
+        """Append a formatted suggestion to buf"""
         priority_colors = {
             'high': '🔴',
             'medium': '🟡', 
             'low': '🟢'
         }
         
-        print(f"\n{priority_colors.get(suggestion['priority'], '⚪')} [{index}] {suggestion['message']}")
-        print(f"   💡 {suggestion['suggestion']}")
+        buf.append(f"\n{priority_colors.get(suggestion['priority'], '⚪')} [{index}] {suggestion['message']}\n")
+        buf.append(f"   💡 {suggestion['suggestion']}\n")
         
         if 'code_fix' in suggestion:
-            print(f"\n   📝 Suggested fix:")
-            for line in suggestion['code_fix'].split('\n'):
-                print(f"      {line}")
+            buf.append("\n   📝 Suggested fix:\n")
+            for line in suggestion['code_fix_lines']:
+                buf.append(f"      {line}\n")
         
         if 'code_suggestion' in suggestion:
-            print(f"\n   📝 Generated code:")
+            buf.append("\n   📝 Generated code:\n")
             # Show first few lines
-            lines = suggestion['code_suggestion'].split('\n')[:5]
-            for line in lines:
-                print(f"      {line}")
-            if len(lines) < len(suggestion['code_suggestion'].split('\n')):
-                print("      ... (more code available)")
+            lines = suggestion['code_suggestion_lines']
+            for line in lines[:5]:
+                buf.append(f"      {line}\n")
+            if len(lines) > 5:
+                buf.append("      ... (more code available)\n")
     
     async def execute_suggestion(self, index: int):
         """Execute a specific suggestion"""
@@ -290,7 +427,7 @@ total += item.get('price', 0) * item.get('quantity', 0)'''
             'language': self.current_context.language,
             'framework': self.current_context.framework,
             'has_errors': bool(self.current_context.error_messages),
-            'todos_count': len(self.current_context.todos_visible or []),
+            'todos_count': len(self.current_context.todos_visible),
             'suggestions_available': len(self.suggestions_queue)
         }
 
@@ -320,4 +457,6 @@ if __name__ == "__main__":
     demo_inline_integration()
     
     # Start assistant
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(start_inline_assistant())
\ No newline at end of file
@@ -4,14 +4,18 @@ Cognitive OS Integration Summary
 Shows how screen sharing integrates with Claude Code's workflow for parallel agent management
 """
 
-def show_integration_overview():
-    """Show how the Cognitive OS integrates with development workflow"""
+import sys
+
+def _render_integration_overview() -> str:
+    """Text of the integration overview; it is entirely static"""
+    lines = []
+    emit = lines.append
     
-    print("🧬 COGNITIVE OS v0.4 - WORKFLOW INTEGRATION OVERVIEW")
-    print("=" * 70)
+    emit("🧬 COGNITIVE OS v0.4 - WORKFLOW INTEGRATION OVERVIEW")
+    emit("=" * 70)
     
-    print("\n📋 INTEGRATION LAYERS:")
-    print("""
+    emit("\n📋 INTEGRATION LAYERS:")
+    emit("""
     ┌─────────────────────────────────────────────────────────────┐
     │                 CLAUDE CODE WORKFLOW                        │
     │  🤖 Reading files, writing code, running commands          │
@@ -28,8 +32,8 @@ def show_integration_overview():
     └─────────────────────────────────────────────────────────────┘
     """)
     
-    print("\n🔄 INLINE WORKFLOW INTEGRATION:")
-    print("""
+    emit("\n🔄 INLINE WORKFLOW INTEGRATION:")
+    emit("""
     1. 👨‍💻 I start working on code (reading, writing, debugging)
     2. 📺 Screen sharing captures everything I see
     3. 🧠 AI analyzes screen context in real-time
@@ -44,7 +48,7 @@ def show_integration_overview():
     6. 💡 Agents provide suggestions and automations inline
     """)
     
-    print("\n🎯 PARALLEL AGENT EXAMPLES:")
+    emit("\n🎯 PARALLEL AGENT EXAMPLES:")
     
     agents = [
         {
@@ -74,13 +78,13 @@ def show_integration_overview():
     ]
     
     for i, agent in enumerate(agents, 1):
-        print(f"\n   {i}️⃣ {agent['trigger']}")
-        print(f"      🤖 Spawns: {agent['agent']}")
-        print(f"      📋 Actions: {', '.join(agent['actions'])}")
-        print(f"      🖥️  Terminal: '{agent['terminal']}'")
+        emit(f"\n   {i}️⃣ {agent['trigger']}")
+        emit(f"      🤖 Spawns: {agent['agent']}")
+        emit(f"      📋 Actions: {', '.join(agent['actions'])}")
+        emit(f"      🖥️  Terminal: '{agent['terminal']}'")
     
-    print("\n🚀 USAGE EXAMPLES:")
-    print("""
+    emit("\n🚀 USAGE EXAMPLES:")
+    emit("""
     # Start screen sharing with auto-agents
     python3 -c "import cognitive_tool_integration; cognitive_tool_integration.enable_cognitive_integration()"
     
@@ -93,7 +97,7 @@ def show_integration_overview():
     python3 -c "import cognitive_tool_integration; print(cognitive_tool_integration.get_integration_status())"
     """)
     
-    print("\n💡 KEY BENEFITS:")
+    emit("\n💡 KEY BENEFITS:")
     benefits = [
         "🔄 Non-intrusive - work normally, get enhanced assistance",
         "🧠 Context-aware - agents understand what you're doing",
@@ -104,9 +108,9 @@ def show_integration_overview():
     ]
     
     for benefit in benefits:
-        print(f"   {benefit}")
+        emit(f"   {benefit}")
     
-    print("\n🛠️  ARCHITECTURE COMPONENTS:")
+    emit("\n🛠️  ARCHITECTURE COMPONENTS:")
     components = [
         ("Screen Capture", "auto_screen_capture.html", "Browser-based real-time capture"),
         ("WebSocket Daemon", "enhanced_cognitive_daemon.py", "Frame processing & AI integration"),
@@ -117,14 +121,28 @@ def show_integration_overview():
     ]
     
     for name, file, desc in components:
-        print(f"   📁 {name:<20} {file:<35} {desc}")
+        emit(f"   📁 {name:<20} {file:<35} {desc}")
+    
+    return "\n".join(lines) + "\n"
 
-def show_practical_example():
-    """Show a practical example of the integration in action"""
+# Rendered once at import; the overview is then a single stdout write
+# instead of dozens of prints
+_INTEGRATION_OVERVIEW = _render_integration_overview()
+
+def show_integration_overview():
+    """Show how the Cognitive OS integrates with development workflow"""
     
-    print("\n" + "="*70)
-    print("📝 PRACTICAL EXAMPLE: DEBUGGING A PYTHON FUNCTION")
-    print("="*70)
+    sys.stdout.write(_INTEGRATION_OVERVIEW)
+    sys.stdout.flush()
+
+def _render_practical_example() -> str:
+    """Text of the practical example walkthrough; also entirely static"""
+    lines = []
+    emit = lines.append
+    
+    emit("\n" + "="*70)
+    emit("📝 PRACTICAL EXAMPLE: DEBUGGING A PYTHON FUNCTION")
+    emit("="*70)
     
     steps = [
         {
@@ -158,11 +176,21 @@ def show_practical_example():
     ]
     
     for step_info in steps:
-        print(f"\n🔄 {step_info['step']}")
-        print(f"   👁️  Screen: {step_info['screen']}")
-        print(f"   🧠 Cognitive: {step_info['cognitive']}")
-        print(f"   🤖 Agents: {step_info['agents']}")
-        print(f"   🖥️  Terminal: {step_info['terminal']}")
+        emit(f"\n🔄 {step_info['step']}")
+        emit(f"   👁️  Screen: {step_info['screen']}")
+        emit(f"   🧠 Cognitive: {step_info['cognitive']}")
+        emit(f"   🤖 Agents: {step_info['agents']}")
+        emit(f"   🖥️  Terminal: {step_info['terminal']}")
+    
+    return "\n".join(lines) + "\n"
+
+_PRACTICAL_EXAMPLE = _render_practical_example()
+
+def show_practical_example():
+    """Show a practical example of the integration in action"""
+    
+    sys.stdout.write(_PRACTICAL_EXAMPLE)
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     show_integration_overview()
@@ -82,6 +82,11 @@ class RealtimeCognitiveMirror:
         self.websocket_clients = set()
         self.streaming_active = False
         
+        # Last generated report, served until the state it describes changes
+        self._cached_report = None
+        self._report_version = 0
+        self._report_lock = threading.Lock()
+        
         # Memory integration
         try:
             # Will use MCP memory tools when available
@@ -96,6 +101,7 @@ class RealtimeCognitiveMirror:
         """Start WebSocket server for realtime streaming"""
         async def handle_client(websocket, path):
             self.websocket_clients.add(websocket)
+            self._invalidate_report()
             cognitive_logger.info(f"🔗 Client connected: {websocket.remote_address}")
             
             try:
@@ -111,6 +117,7 @@ class RealtimeCognitiveMirror:
                 cognitive_logger.error(f"❌ Client error: {e}")
             finally:
                 self.websocket_clients.discard(websocket)
+                self._invalidate_report()
                 cognitive_logger.info("🔌 Client disconnected")
         
         # Start server in background thread
@@ -166,16 +173,18 @@ class RealtimeCognitiveMirror:
             'data': event.to_dict()
         })
         
-        # Send to all clients
-        disconnected = set()
-        for client in self.websocket_clients:
-            try:
-                await client.send(message)
-            except:
-                disconnected.add(client)
+        # Send to all clients concurrently; the sends are independent, so one
+        # slow socket shouldn't hold up delivery to the others
+        clients = list(self.websocket_clients)
+        results = await asyncio.gather(*(client.send(message) for client in clients),
+                                       return_exceptions=True)
         
         # Clean up disconnected clients
-        self.websocket_clients -= disconnected
+        failed = [client for client, result in zip(clients, results)
+                  if isinstance(result, Exception)]
+        if failed:
+            self.websocket_clients.difference_update(failed)
+            self._invalidate_report()
     
     def _update_cognitive_state(self, event: CognitiveStreamEvent):
         """Update my internal cognitive state based on the event"""
@@ -207,6 +216,14 @@ class RealtimeCognitiveMirror:
             })
             if len(self.working_memory) > 8:  # Memory limit
                 self.working_memory.pop(0)
+        
+        self._invalidate_report()
+    
+    def _invalidate_report(self):
+        """Drop the cached report after a state change"""
+        with self._report_lock:
+            self._report_version += 1
+            self._cached_report = None
     
     def _get_current_state(self):
         """Get current cognitive state snapshot"""
@@ -399,6 +416,18 @@ class RealtimeCognitiveMirror:
                 'server_url': 'ws://localhost:8085'
             }
         }
+    
+    def get_cached_report(self):
+        """Return the last cognitive report, regenerating it only if state changed since"""
+        report = self._cached_report
+        if report is None:
+            version = self._report_version
+            report = self.generate_cognitive_report()
+            with self._report_lock:
+                # An event landing mid-generation makes this report stale
+                if version == self._report_version:
+                    self._cached_report = report
+        return report
 
 # Global cognitive mirror instance
 _cognitive_mirror = None
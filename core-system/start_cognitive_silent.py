@@ -5,6 +5,7 @@ Start Cognitive OS silently with all components as background subprocesses
 
 import subprocess
 import time
+import json
 import os
 import sys
 import signal
@@ -40,7 +41,8 @@ def start_cognitive_silent():
         [sys.executable, os.path.join(base_dir, "enhanced_cognitive_daemon.py")],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        cwd=base_dir
+        cwd=base_dir,
+        start_new_session=True  # own process group, so stop can killpg() it
     )
     subprocesses.append(daemon_proc)
     print(f"✅ Daemon started (PID: {daemon_proc.pid})")
@@ -77,19 +79,22 @@ def start_cognitive_silent():
             [sys.executable, os.path.join(base_dir, "live_screen_monitor.py")],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            cwd=base_dir
+            cwd=base_dir,
+            start_new_session=True
         )
         subprocesses.append(monitor_proc)
         print(f"✅ Monitor started (PID: {monitor_proc.pid})")
     
     # Step 4: Save process info
+    # Each *_pid is also its process group id (start_new_session=True)
     pid_file = os.path.join(base_dir, ".cognitive_pids")
+    process_info = {"daemon_pid": daemon_proc.pid}
+    if monitor_proc:
+        process_info["monitor_pid"] = monitor_proc.pid
+    process_info["websocket_port"] = 8084
+    process_info["timestamp"] = time.time()
     with open(pid_file, "w") as f:
-        f.write(f"daemon_pid={daemon_proc.pid}\n")
-        if monitor_proc:
-            f.write(f"monitor_pid={monitor_proc.pid}\n")
-        f.write(f"websocket_port=8084\n")
-        f.write(f"timestamp={time.time()}\n")
+        json.dump(process_info, f)
     
     print("\n" + "=" * 50)
     print("🚀 COGNITIVE OS RUNNING IN BACKGROUND")
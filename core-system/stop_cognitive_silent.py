@@ -4,8 +4,8 @@ Stop Cognitive OS background processes
 """
 
 import os
+import json
 import signal
-import subprocess
 
 def stop_cognitive_silent():
     """Stop all Cognitive OS background processes"""
@@ -19,18 +19,34 @@ def stop_cognitive_silent():
     # Read PIDs from file
     if os.path.exists(pid_file):
         print(f"📁 Reading PIDs from {pid_file}")
-        pids = {}
         with open(pid_file, "r") as f:
-            for line in f:
-                if "=" in line:
-                    key, value = line.strip().split("=")
-                    if "pid" in key:
-                        pids[key] = int(value)
+            contents = f.read()
+        try:
+            process_info = json.loads(contents)
+        except ValueError:
+            process_info = None
         
-        # Stop processes
-        for name, pid in pids.items():
+        if isinstance(process_info, dict):
+            # start_cognitive_silent launches every component in its own
+            # session, so each recorded pid is a process group id: one
+            # killpg() stops the component together with anything it spawned
+            kill = os.killpg
+        else:
+            # PID file from an older start script: key=value lines (or a bare
+            # pid) naming plain processes, not group leaders
+            process_info = {}
+            for line in contents.splitlines():
+                key, _, value = line.strip().rpartition("=")
+                key = key or "pid"
+                if "pid" in key and value.isdigit():
+                    process_info[key] = int(value)
+            kill = os.kill
+        
+        for name, pid in process_info.items():
+            if not name.endswith("_pid") and name != "pid":
+                continue
             try:
-                os.kill(pid, signal.SIGTERM)
+                kill(pid, signal.SIGTERM)
                 print(f"✅ Stopped {name}: {pid}")
             except ProcessLookupError:
                 print(f"⚠️ Process {name} ({pid}) not found")
@@ -43,46 +59,6 @@ def stop_cognitive_silent():
     else:
         print("⚠️ No PID file found")
     
-    # Also try to find and stop any cognitive processes
-    print("\n🔍 Searching for any remaining cognitive processes...")
-    try:
-        # Find cognitive daemon processes
-        result = subprocess.run(
-            ["pgrep", "-f", "cognitive_daemon"],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.stdout:
-            pids = result.stdout.strip().split("\n")
-            for pid in pids:
-                if pid:
-                    try:
-                        os.kill(int(pid), signal.SIGTERM)
-                        print(f"✅ Stopped cognitive daemon PID: {pid}")
-                    except:
-                        pass
-        
-        # Find screen monitor processes
-        result = subprocess.run(
-            ["pgrep", "-f", "live_screen_monitor"],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.stdout:
-            pids = result.stdout.strip().split("\n")
-            for pid in pids:
-                if pid:
-                    try:
-                        os.kill(int(pid), signal.SIGTERM)
-                        print(f"✅ Stopped screen monitor PID: {pid}")
-                    except:
-                        pass
-                        
-    except Exception as e:
-        print(f"⚠️ Error searching for processes: {e}")
-    
     print("\n✅ All Cognitive OS processes stopped")
 
 if __name__ == "__main__":
@@ -46,6 +46,7 @@ class TerminalDashboard:
         curses.init_pair(5, curses.COLOR_MAGENTA, curses.COLOR_BLACK) # Highlight
         curses.init_pair(6, curses.COLOR_WHITE, curses.COLOR_BLUE)    # Header
         
+        next_refresh = time.monotonic()
         while self.running:
             try:
                 # Clear screen
@@ -68,8 +69,15 @@ class TerminalDashboard:
                 # Refresh screen
                 stdscr.refresh()
                 
-                # Sleep
-                time.sleep(self.refresh_rate)
+                # Sleep until the next refresh deadline rather than a fixed
+                # interval, so render time doesn't stretch the refresh period
+                next_refresh += self.refresh_rate
+                delay = next_refresh - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Fell behind (slow render or error pause); resync
+                    next_refresh = time.monotonic()
                 
             except KeyboardInterrupt:
                 self.running = False
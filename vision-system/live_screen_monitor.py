@@ -11,6 +11,15 @@ from datetime import datetime
 from PIL import Image
 import io
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses the received str/bytes directly and raises a subclass of
+# json.JSONDecodeError, so it drops in for json.loads
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 class LiveScreenMonitor:
     def __init__(self):
         self.frame_count = 0
@@ -27,7 +36,7 @@ class LiveScreenMonitor:
                 
                 # Wait for welcome
                 welcome = await websocket.recv()
-                welcome_data = json.loads(welcome)
+                welcome_data = _json_loads(welcome)
                 print(f'✅ Connected to: {welcome_data["session_id"]}')
                 print(f'🔧 Capabilities: {", ".join(welcome_data["capabilities"])}')
                 
@@ -38,7 +47,7 @@ class LiveScreenMonitor:
                 while True:
                     try:
                         message = await asyncio.wait_for(websocket.recv(), timeout=3.0)
-                        data = json.loads(message)
+                        data = _json_loads(message)
                         
                         await self.process_message(data)
                         
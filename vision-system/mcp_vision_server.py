@@ -16,8 +16,14 @@ import io
 import numpy as np
 import logging
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from collections.abc import AsyncIterator
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
 from mcp.server.fastmcp import FastMCP, Context
 
 logging.basicConfig(
@@ -287,24 +293,10 @@ async def send_test_frame(ctx: Context) -> Dict[str, Any]:
         return {"error": "Not connected to vision source"}
     
     try:
-        # Create synthetic frame
-        img = Image.new('RGB', (800, 600), color=(20, 20, 20))
-        from PIL import ImageDraw
-        draw = ImageDraw.Draw(img)
-        
-        # Draw terminal-like content
-        draw.text((20, 30), "$ Testing MCP vision server", fill=(0, 255, 0))
-        draw.text((20, 60), ">>> Vision system active", fill=(0, 255, 0))
-        
-        # Convert to base64
-        buffer = io.BytesIO()
-        img.save(buffer, format='JPEG', quality=85)
-        base64_data = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        
         # Send frame
         frame_msg = {
             'type': 'screen_frame',
-            'data': base64_data,
+            'data': _test_frame_base64(),
             'width': 800,
             'height': 600,
             'timestamp': datetime.now(UTC).isoformat()
@@ -323,6 +315,31 @@ async def send_test_frame(ctx: Context) -> Dict[str, Any]:
 
 
 # Helper functions
+@lru_cache(maxsize=None)
+def _test_frame_base64() -> str:
+    """Render the synthetic terminal frame once and return it as base64 JPEG"""
+    # Create synthetic frame
+    img = Image.new('RGB', (800, 600), color=(20, 20, 20))
+    from PIL import ImageDraw
+    draw = ImageDraw.Draw(img)
+    
+    # Draw terminal-like content
+    draw.text((20, 30), "$ Testing MCP vision server", fill=(0, 255, 0))
+    draw.text((20, 60), ">>> Vision system active", fill=(0, 255, 0))
+    
+    # Convert to base64
+    buffer = io.BytesIO()
+    img.save(buffer, format='JPEG', quality=85)
+    # getbuffer() exposes the JPEG in place; getvalue() would copy it out
+    jpeg_view = buffer.getbuffer()
+    if pybase64 is not None:
+        base64_data = pybase64.b64encode_as_string(jpeg_view)
+    else:
+        base64_data = base64.b64encode(jpeg_view).decode('utf-8')
+    jpeg_view.release()
+    return base64_data
+
+
 def _describe_frame(frame: Dict[str, Any]) -> str:
     """Generate natural language description of frame"""
     ui_type = frame.get("detected_ui_type", "unknown")
@@ -9,20 +9,59 @@ import websockets
 import json
 import base64
 from datetime import datetime, UTC
-from typing import Dict, Any, Set, Optional
+from typing import Dict, Any, Set, Optional, List
 import logging
-from PIL import Image
+from PIL import Image, ImageStat
 import io
-import numpy as np
+import math
+import concurrent.futures
 from dataclasses import dataclass, asdict, field
 import time
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+_b64decode = pybase64.b64decode if pybase64 is not None else base64.b64decode
+
+
+# (epoch second, formatted date/time prefix) of the last timestamp produced
+_iso_cache = [None, '']
+
+
+def _utc_now_iso() -> str:
+    """UTC ISO-8601 timestamp; the calendar part is only reformatted once per second"""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if seconds != _iso_cache[0]:
+        _iso_cache[0] = seconds
+        _iso_cache[1] = datetime.fromtimestamp(seconds, UTC).strftime('%Y-%m-%dT%H:%M:%S')
+    return f"{_iso_cache[1]}.{nanos // 1000:06d}+00:00"
+
+
+def _dumps(message: Dict[str, Any]) -> str:
+    """Serialize an outgoing message as text (the browser client JSON.parse()s it)"""
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message)
+
+def _decode_rgb(img_data: bytes) -> Image.Image:
+    """Decode a frame to a full-resolution RGB image"""
+    # Contrast and per-band stddev depend on fine detail (text edges), which
+    # a reduced-scale decode averages away, so frames are measured at full size
+    return Image.open(io.BytesIO(img_data)).convert('RGB')
+
 
 @dataclass
 class FrameAnalysis:
@@ -51,6 +90,16 @@ class UnifiedVisionServer:
         self.last_frame_analysis: Optional[FrameAnalysis] = None
         self.analysis_cache = []
         self.max_cache = 10
+        # Payload and (brightness, contrast, colour, ui type) of the last
+        # decoded frame, so an unchanged screen is not decoded again
+        self._last_frame_data: Optional[str] = None
+        self._last_metrics: Optional[tuple] = None
+        # base64/JPEG decoding and ImageStat release the GIL, so one worker
+        # thread keeps them off the event loop without pickling frames
+        self._decode_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='frame-decode')
+        # In-flight fan-outs; held so the tasks aren't garbage collected
+        self._broadcast_tasks: Set[asyncio.Task] = set()
         
     async def handle_client(self, websocket):
         """Handle all client connections - browser or analysis consumers"""
@@ -64,7 +113,7 @@ class UnifiedVisionServer:
                 'type': 'connected',
                 'server': 'unified_vision_server',
                 'version': '1.0',
-                'timestamp': datetime.now(UTC).isoformat()
+                'timestamp': _utc_now_iso()
             }))
             
             async for message in websocket:
@@ -76,16 +125,22 @@ class UnifiedVisionServer:
                         # Process incoming screen frame
                         analysis = await self.process_frame(data)
                         
+                        # Serialize the analysis once; the acknowledgment
+                        # and the broadcast both embed the same JSON text
+                        analysis_json = _dumps(asdict(analysis))
+                        
                         # Send back acknowledgment with analysis
-                        response = {
-                            'type': 'frame_processed',
-                            'frame_id': analysis.frame_id,
-                            'analysis': asdict(analysis)
-                        }
-                        await websocket.send(json.dumps(response))
+                        await websocket.send(
+                            '{"type": "frame_processed", "frame_id": %d, "analysis": %s}'
+                            % (analysis.frame_id, analysis_json))
                         
-                        # Broadcast analysis to all other clients
-                        await self.broadcast_analysis(analysis, exclude=websocket)
+                        # Broadcast analysis to all other clients. Not
+                        # awaited: the next frame is read and decoded while
+                        # this one is still going out to the consumers
+                        task = asyncio.create_task(
+                            self.broadcast_analysis(analysis_json, exclude=websocket))
+                        self._broadcast_tasks.add(task)
+                        task.add_done_callback(self._broadcast_tasks.discard)
                         
                     elif message_type == 'get_history':
                         # Send analysis history
@@ -99,7 +154,7 @@ class UnifiedVisionServer:
                         await websocket.send(json.dumps({
                             'type': 'test_response',
                             'echo': data.get('message', ''),
-                            'timestamp': datetime.now(UTC).isoformat()
+                            'timestamp': _utc_now_iso()
                         }))
                         
                 except json.JSONDecodeError:
@@ -113,29 +168,32 @@ class UnifiedVisionServer:
         except websockets.exceptions.ConnectionClosed:
             logger.info(f"Client disconnected: {client_addr}")
         finally:
-            self.clients.remove(websocket)
+            self.clients.discard(websocket)
     
     async def process_frame(self, frame_data: Dict[str, Any]) -> FrameAnalysis:
         """Process and analyze incoming frame"""
-        self.frame_count += 1
         start_time = time.time()
         
-        # Decode frame
         frame_base64 = frame_data.get('data', '')
-        img_data = base64.b64decode(frame_base64)
-        img = Image.open(io.BytesIO(img_data))
-        img_array = np.array(img)
-        
-        # Basic visual analysis
-        brightness = np.mean(img_array) / 255.0
-        contrast = np.std(img_array) / 255.0
-        
-        # Color analysis
-        avg_color = np.mean(img_array.reshape(-1, 3), axis=0)
-        dominant_color = self._describe_color(avg_color)
-        
-        # UI type detection
-        ui_type = self._detect_ui_type(img_array, brightness, contrast)
+        if frame_base64 == self._last_frame_data:
+            # Idle screen: the browser sent byte-identical JPEG data. String
+            # equality is a length check plus memcmp, far cheaper than a
+            # decode, so reuse the previous frame's metrics
+            brightness, contrast, dominant_color, ui_type = self._last_metrics
+        else:
+            # Decoding blocks for milliseconds per frame; run it off the loop
+            # so other clients' sockets keep being serviced meanwhile
+            metrics = await asyncio.get_running_loop().run_in_executor(
+                self._decode_pool, self._measure_frame, frame_base64)
+            brightness, contrast, dominant_color, ui_type = metrics
+            self._last_frame_data = frame_base64
+            self._last_metrics = metrics
+        
+        # Everything from here to the cache update runs without yielding, so
+        # the frame id, the change baseline (last_frame_analysis) and the
+        # cache are updated as one step. Frames from several clients that
+        # finished decoding in either order therefore can't interleave.
+        self.frame_count += 1
         
         # Change detection
         changes = self._detect_changes(brightness, contrast, ui_type)
@@ -149,7 +207,7 @@ class UnifiedVisionServer:
         
         analysis = FrameAnalysis(
             frame_id=self.frame_count,
-            timestamp=datetime.now(UTC).isoformat(),
+            timestamp=_utc_now_iso(),
             content_type=ui_type,
             brightness=round(brightness, 3),
             contrast=round(contrast, 3),
@@ -173,7 +231,36 @@ class UnifiedVisionServer:
         
         return analysis
     
-    def _describe_color(self, rgb: np.ndarray) -> str:
+    def _measure_frame(self, frame_base64: str) -> tuple:
+        """Decode a frame and return (brightness, contrast, colour, ui type)
+
+        Runs on the decode thread, so it must not touch mutable server state.
+        """
+        # Decode frame
+        img_data = _b64decode(frame_base64, validate=False)
+        img = _decode_rgb(img_data)
+        
+        # Basic visual analysis
+        # ImageStat builds one 256-bin histogram per band in C; every
+        # whole-frame statistic below is derived from those, so the pixels
+        # are read exactly once and no float copy of the frame is made
+        stat = ImageStat.Stat(img)
+        channel_mean = stat.mean
+        brightness = sum(channel_mean) / 3 / 255.0
+        # Overall variance = mean within-band variance + variance of band means
+        mean_of_means = sum(channel_mean) / 3
+        spread = sum((m - mean_of_means) ** 2 for m in channel_mean) / 3
+        contrast = math.sqrt(sum(stat.var) / 3 + spread) / 255.0
+        
+        # Color analysis
+        dominant_color = self._describe_color(channel_mean)
+        
+        # UI type detection
+        ui_type = self._detect_ui_type(img, stat, brightness, contrast)
+        
+        return brightness, contrast, dominant_color, ui_type
+    
+    def _describe_color(self, rgb: List[float]) -> str:
         """Convert RGB to color description"""
         r, g, b = rgb
         
@@ -193,17 +280,17 @@ class UnifiedVisionServer:
         else:
             return "mixed"
     
-    def _detect_ui_type(self, img_array: np.ndarray, brightness: float, contrast: float) -> str:
+    def _detect_ui_type(self, img: Image.Image, stat: ImageStat.Stat,
+                        brightness: float, contrast: float) -> str:
         """Detect type of UI being displayed"""
-        height, width = img_array.shape[:2]
+        width, height = img.size
         
         # Analyze top region
-        top_region = img_array[:height//5]
-        top_brightness = np.mean(top_region) / 255.0
+        top_region = img.crop((0, 0, width, max(1, height // 5)))
+        top_brightness = sum(ImageStat.Stat(top_region).mean) / 3 / 255.0
         
         # Analyze color variance
-        color_variance = np.std(img_array.reshape(-1, 3), axis=0)
-        is_monochrome = np.max(color_variance) < 20
+        is_monochrome = max(stat.stddev) < 20
         
         # Decision tree for UI type
         if brightness < 0.2 and is_monochrome:
@@ -277,23 +364,21 @@ class UnifiedVisionServer:
         
         return insights
     
-    async def broadcast_analysis(self, analysis: FrameAnalysis, exclude=None):
-        """Broadcast analysis to all connected clients except sender"""
-        message = json.dumps({
-            'type': 'live_analysis',
-            'analysis': asdict(analysis)
-        })
-        
-        disconnected = set()
-        for client in self.clients:
-            if client != exclude:
-                try:
-                    await client.send(message)
-                except:
-                    disconnected.add(client)
+    async def broadcast_analysis(self, analysis_json: str, exclude=None):
+        """Broadcast pre-serialized analysis to all connected clients except sender"""
+        recipients = [client for client in self.clients if client != exclude]
+        if not recipients:
+            return
+        message = '{"type": "live_analysis", "analysis": %s}' % analysis_json
+        
+        # Send to everyone concurrently so one slow socket doesn't delay the rest
+        results = await asyncio.gather(*(client.send(message) for client in recipients),
+                                       return_exceptions=True)
         
         # Clean up disconnected clients
-        self.clients -= disconnected
+        self.clients.difference_update(
+            client for client, result in zip(recipients, results)
+            if isinstance(result, Exception))
     
     async def start_server(self):
         """Start the unified vision server"""
@@ -312,6 +397,8 @@ class UnifiedVisionServer:
             logger.info("Shutting down server...")
             server.close()
             await server.wait_closed()
+        finally:
+            self._decode_pool.shutdown(wait=False)
 
 
 async def main():